@@ -10,6 +10,14 @@ from dotenv import load_dotenv
 from espn_api.football import League
 from tabulate import tabulate
 import json
+import time
+import datetime
+import traceback
+import heapq
+from collections import defaultdict
+from difflib import get_close_matches
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 
 class LeagueManager:
     def __init__(self):
@@ -60,6 +68,7 @@ class LeagueManager:
 
         # Store league info
         league_key = f"{league_id}_{user_id}"
+        self.drop_cached_league(league_key)
         self.data['leagues'][league_key] = {
             'name': league_name_from_api or league_name,
             'league_id': league_id,
@@ -98,7 +107,17 @@ class LeagueManager:
                 leagues.append(self.data['leagues'][league_key])
         return leagues
 
-    def get_league_connection(self, user_id, league_key=None):
+    def get_user_context(self, user_id):
+        """Get a user's leagues and default league key from a single user lookup"""
+        user_data = self.data['users'].get(str(user_id))
+        if not user_data:
+            return [], None
+
+        leagues_data = self.data['leagues']
+        leagues = [leagues_data[league_key] for league_key in user_data['leagues'] if league_key in leagues_data]
+        return leagues, user_data.get('default_league')
+
+    def get_league_connection(self, user_id, league_key=None, use_cache=False):
         """Get a League object for the user's default or specified league"""
         user_id = str(user_id)
 
@@ -108,26 +127,7 @@ class LeagueManager:
                 return None
             league_key = self.data['users'][user_id]['default_league']
 
-        if league_key not in self.data['leagues']:
-            return None
-
-        league_info = self.data['leagues'][league_key]
-
-        try:
-            if league_info['swid'] and league_info['espn_s2']:
-                return League(
-                    league_id=league_info['league_id'],
-                    year=league_info['year'],
-                    swid=league_info['swid'],
-                    espn_s2=league_info['espn_s2']
-                )
-            else:
-                return League(
-                    league_id=league_info['league_id'],
-                    year=league_info['year']
-                )
-        except Exception:
-            return None
+        return self.get_league_by_key(league_key, use_cache=use_cache)
 
     def set_default_league(self, user_id, league_key):
         """Set a user's default league"""
@@ -155,6 +155,7 @@ class LeagueManager:
             # Remove from leagues dict if user was the owner
             if league_key in self.data['leagues'] and self.data['leagues'][league_key]['owner_id'] == user_id:
                 del self.data['leagues'][league_key]
+                self.drop_cached_league(league_key)
 
             self.save_data()
             return True
@@ -173,13 +174,18 @@ class LeagueManager:
             })
         return leagues
 
-    def get_league_by_key(self, league_key):
-        """Get a League object by league key"""
+    def get_league_by_key(self, league_key, use_cache=False):
+        """Get a League object by league key, optionally reusing a connection younger than LEAGUE_CACHE_TTL"""
+        if use_cache:
+            return get_cached_league_data(('league', league_key), lambda: self.get_league_by_key(league_key), LEAGUE_CACHE_TTL)
+
         if league_key not in self.data['leagues']:
             return None
 
-        league_info = self.data['leagues'][league_key]
+        return self.connect_league(self.data['leagues'][league_key])
 
+    def connect_league(self, league_info):
+        """Create a League object from a stored league record"""
         try:
             if league_info['swid'] and league_info['espn_s2']:
                 return League(
@@ -196,6 +202,10 @@ class LeagueManager:
         except Exception:
             return None
 
+    def drop_cached_league(self, league_key):
+        """Forget the cached connection for a league whose registration changed"""
+        _league_cache.pop(('league', league_key), None)
+
     def find_leagues_by_name(self, league_name):
         """Find leagues that match a name pattern"""
         matches = []
@@ -223,6 +233,23 @@ class LeagueManager:
                     'year': league_info['year']
                 })
 
+        # Typo tolerance - fall back to the closest league name when nothing matched
+        if not matches:
+            # Several leagues can share a name (e.g. different seasons), so each name maps to all its keys
+            keys_by_name = defaultdict(list)
+            for league_key, league_info in self.data['leagues'].items():
+                keys_by_name[league_info['name'].lower().strip()].append(league_key)
+            for close_name in get_close_matches(search_name, keys_by_name, n=3, cutoff=LEAGUE_NAME_MATCH_CUTOFF):
+                for league_key in keys_by_name[close_name]:
+                    league_info = self.data['leagues'][league_key]
+                    matches.append({
+                        'key': league_key,
+                        'name': league_info['name'],
+                        'league_id': league_info['league_id'],
+                        'owner_id': league_info['owner_id'],
+                        'year': league_info['year']
+                    })
+
         return matches
 
 # Initialize league manager
@@ -233,11 +260,12 @@ def get_current_week_points(player, league):
     # Get current week from league
     current_week = getattr(league, 'current_week', 1)
 
-    # Try to get current week stats from player.stats
-    if hasattr(player, 'stats') and player.stats:
+    # Try to get current week stats from player.stats (read the attribute once)
+    stats = getattr(player, 'stats', None)
+    if stats:
         try:
             # ESPN API stores stats by week - try to get current week's actual or projected points
-            week_stats = player.stats.get(current_week, {})
+            week_stats = stats.get(current_week) or {}
 
             # Try actual points first (for games in progress or completed)
             actual_points = week_stats.get('points', None)
@@ -265,6 +293,46 @@ def get_current_week_points(player, league):
         or 'N/A'
     )
 
+def has_actual_points(player, current_week):
+    """Check if player has actual points (not just projected) for the given week"""
+    stats = getattr(player, 'stats', None)
+    week_stats = stats.get(current_week) if stats else None
+    if week_stats:
+        # Look for actual points, or applied stats (actual game stats) - either means the player has played
+        actual_points = week_stats.get('points')
+        if (isinstance(actual_points, (int, float)) and actual_points > 0) or week_stats.get('appliedStats'):
+            return True
+
+    # Check if player has game-specific attributes indicating they played
+    game_played = getattr(player, 'game_played', 0)
+    return isinstance(game_played, (int, float)) and game_played > 0
+
+def get_week_actual_points(player, current_week):
+    """Get a player's recorded points for the given week, or 0"""
+    stats = getattr(player, 'stats', None)
+    week_stats = stats.get(current_week) if stats else None
+    if week_stats:
+        actual_points = week_stats.get('points')
+        if isinstance(actual_points, (int, float)) and actual_points > 0:
+            return actual_points
+    return 0
+
+def get_actual_points_only(player, current_week):
+    """Get only actual points (not projected) for the given week"""
+    actual_points = get_week_actual_points(player, current_week)
+    if actual_points:
+        return actual_points
+
+    # Calculate points from applied stats (actual game performance) if available
+    stats = getattr(player, 'stats', None)
+    week_stats = stats.get(current_week) if stats else None
+    applied_stats = week_stats.get('appliedStats') if week_stats else None
+    if applied_stats:
+        total_points = sum(value for value in applied_stats.values() if isinstance(value, (int, float)) and value > 0)
+        if total_points > 0:
+            return total_points
+    return 0
+
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
 LEAGUE_ID = int(os.getenv('ESPN_LEAGUE_ID'))
@@ -276,8 +344,72 @@ ESPN_S2 = os.getenv('ESPN_S2')
 DISCORD_EMBED_FIELD_LIMIT = 25  # Discord's limit for embed fields
 DISCORD_EMBED_CHAR_LIMIT = 1024  # Discord's character limit per embed field
 DISCORD_MESSAGE_CHAR_LIMIT = 2000  # Discord's character limit per message
+DISCORD_MESSAGE_EMBED_LIMIT = 10  # Discord's limit for embeds per message
+DISCORD_MESSAGE_EMBED_TEXT_LIMIT = 6000  # Discord's limit for the combined text of all embeds in a message
 SCOREBOARD_CHAR_LIMIT = 1800  # Character limit for scoreboard embeds
+SCOREBOARD_MAX_TABLE_EMBEDS = DISCORD_MESSAGE_EMBED_LIMIT - 2  # Leaves room for the header and summary embeds
+SCOREBOARD_SUMMARY_RESERVE = 400  # Embed text kept free for the week summary embed and the "+N more" footer
 AUTO_REFRESH_INTERVAL = 30  # Seconds between auto-refresh updates
+TEAM_NAME_MATCH_CUTOFF = 0.6  # Minimum difflib similarity for "did you mean" team suggestions
+LEAGUE_NAME_MATCH_CUTOFF = 0.75  # Minimum difflib similarity for matching a mistyped league name
+LEAGUE_CACHE_TTL = 300  # Seconds a cached league connection is reused by /league_info (settings and season totals only)
+
+# Injury statuses that are not flagged as a risk
+HEALTHY_INJURY_STATUSES = frozenset({'ACTIVE', 'NORMAL'})
+
+# Standings order - wins first, then points for as the tiebreaker
+RECORD_RANK_KEY = attrgetter('wins', 'points_for')
+
+# Injury statuses for starters who won't play this week
+OUT_INJURY_STATUSES = frozenset({'OUT', 'IR', 'SUSPENDED'})
+
+# Lineup display order for starters - position -> sort priority
+POSITION_PRIORITY = {pos: i for i, pos in enumerate(['QB', 'RB', 'WR', 'TE', 'FLEX', 'K', 'D/ST', 'DST'])}
+
+# Lineup table injury suffixes - healthy and unknown statuses show nothing
+LINEUP_STATUS_SUFFIXES = {'QUESTIONABLE': ' (Q)', 'OUT': ' (O)', 'INJURY_RESERVE': ' (IR)'}
+
+# Cross-league lineup table layout - Pos (3) | Player (18) | Pts (4)
+LINEUP_TEXT_HEADER = f"{'Pos':<3} {'Player':<18} {'Pts':<4}"
+LINEUP_TEXT_DIVIDER = f"{'-'*3} {'-'*18} {'-'*4}"
+
+# League info key scoring rules - (ESPN stat abbreviation, label) in display order
+KEY_SCORING_RULES = (
+    ('PTD', '🎯 Passing TD'),
+    ('RTD', '🏃 Rushing TD'),
+    ('RETD', '🤲 Receiving TD'),
+)
+
+# Roster view injury status abbreviations
+ROSTER_STATUS_ABBREVS = {
+    'ACTIVE': 'A', 'QUESTIONABLE': 'Q', 'OUT': 'O', 'INJURY_RESERVE': 'IR', 'NORMAL': 'N', None: ''
+}
+
+# Defense positions never show an injury status
+DST_POSITIONS = frozenset({'D/ST', 'DST', 'DEF'})
+
+# Status abbreviations for available players - hidden in roster lines
+HIDDEN_STATUS_ABBREVS = frozenset({'A', 'N'})
+
+# Team card progress bars - every possible fill level is prebuilt
+PROGRESS_BAR_LENGTH = 10
+PROGRESS_BARS = tuple("=" * filled + "-" * (PROGRESS_BAR_LENGTH - filled) for filled in range(PROGRESS_BAR_LENGTH + 1))
+
+# Matchup table layout - each side is 25 chars wide (3+1+15+1+5), joined by ' | '
+MATCHUP_DIVIDER_LINE = f"{'-'*25} | {'-'*25}"
+MATCHUP_TOTAL_FORMAT = f"{'TOT':<3} {'TOTAL':<15} {{:>5.1f}} | {{:<5.1f}} {'TOTAL':<15} {'TOT':>3}"
+
+# Scoreboard matchup lines - team names are padded to SCOREBOARD_NAME_WIDTH (room for double digit
+# player counts), scores are right/left aligned around the divider and the triangle points at the leader
+SCOREBOARD_NAME_WIDTH = 18
+SCOREBOARD_TEAM1_LEADS_FORMAT = "{} {:>6.1f} ▶ |   {:<6.1f} {}"
+SCOREBOARD_TEAM2_LEADS_FORMAT = "{} {:>6.1f}   | ◀ {:<6.1f} {}"
+SCOREBOARD_TIED_FORMAT = "{} {:>6.1f}  |   {:<6.1f} {}"
+# Indexed by the score comparison: 0 tied, 1 team 1 leads, -1 team 2 leads
+SCOREBOARD_LINE_FORMATS = (SCOREBOARD_TIED_FORMAT, SCOREBOARD_TEAM1_LEADS_FORMAT, SCOREBOARD_TEAM2_LEADS_FORMAT)
+
+# Scoreboard header footer - rendered with time.strftime on each refresh
+SCOREBOARD_FOOTER_FORMAT = "Last updated: %I:%M:%S %p"
 
 # Error handling utilities
 async def safe_interaction_response(interaction, content, ephemeral=False, embed=None, embeds=None, view=None):
@@ -355,7 +487,6 @@ class MyClient(discord.Client):
 
     async def on_error(self, event, *args, **kwargs):
         """Global error handler to prevent bot crashes"""
-        import traceback
         print(f"Discord.py error in {event}:")
         traceback.print_exc()
         # Bot continues running instead of crashing
@@ -381,13 +512,11 @@ def get_league_name(user_id=None):
     # Fallback to default
     return "Fantasy League"
 
-def get_league(user_id=None, league_key=None, timeout_retries=API_RETRY_ATTEMPTS):
+def get_league(user_id=None, league_key=None, timeout_retries=API_RETRY_ATTEMPTS, use_cache=False):
     """Initialize and return league instance with proper authentication and timeout handling"""
-    import time
-
     # If user_id is provided, try to get their league
     if user_id:
-        user_league = league_manager.get_league_connection(user_id, league_key)
+        user_league = league_manager.get_league_connection(user_id, league_key, use_cache=use_cache)
         if user_league:
             return user_league
 
@@ -420,25 +549,84 @@ def get_proj(player):
     """Get projected points for a player"""
     return getattr(player, 'projected_total_points', 0)
 
-def validate_team_name(team_name, league_teams):
-    """Validate and normalize team name input"""
-    if not team_name or not isinstance(team_name, str):
-        return None
-
-    # Remove extra whitespace and convert to lowercase for comparison
-    normalized_input = team_name.strip().lower()
-
-    # Try exact match first
-    for team in league_teams:
-        if team.team_name.lower() == normalized_input:
-            return team
-
-    # Try partial match
-    for team in league_teams:
-        if normalized_input in team.team_name.lower():
-            return team
-
-    return None
+PROJECTED_POINTS_ATTRS = ('projected_points', 'projected_total_points', 'proj_score')
+
+def get_projected_points(player):
+    """Get the first available projection attribute for a player, or 'N/A'"""
+    for attr in PROJECTED_POINTS_ATTRS:
+        value = getattr(player, attr, None)
+        if value is not None:
+            return value
+    return 'N/A'
+
+def get_team_name_index(league):
+    """Get a {lowercase team name: team} index, built once per league object"""
+    name_index = getattr(league, '_team_name_index', None)
+    if name_index is None:
+        # Built from the reversed list so the first team wins when names collide after lowercasing
+        name_index = {t.team_name.lower(): t for t in reversed(league.teams)}
+        league._team_name_index = name_index
+    return name_index
+
+def get_team_names_text(league):
+    """Get a comma-separated list of the league's team names, built once per league object"""
+    names_text = getattr(league, '_team_names_text', None)
+    if names_text is None:
+        names_text = ", ".join(t.team_name for t in league.teams)
+        league._team_names_text = names_text
+    return names_text
+
+def find_team(league, team_name):
+    """Find a team by exact name, falling back to a partial match (case-insensitive)"""
+    name_index = get_team_name_index(league)
+    search_name = team_name.lower()
+    team = name_index.get(search_name)
+    if team is None:
+        # Partial matches scan league.teams, since the index is built in reverse order
+        team = next((t for t in league.teams if search_name in t.team_name.lower()), None)
+    return team
+
+def suggest_team_name(league, team_name):
+    """Get the league team name closest to a mistyped team name, or None"""
+    name_index = get_team_name_index(league)
+    close_names = get_close_matches(team_name.lower(), name_index, n=1, cutoff=TEAM_NAME_MATCH_CUTOFF)
+    return name_index[close_names[0]].team_name if close_names else None
+
+def get_position_priority(player):
+    """Sort key placing starters in lineup slot order, unknown positions last"""
+    return POSITION_PRIORITY.get(getattr(player, 'position', 'FLEX'), 99)
+
+def get_player_status(player):
+    """Get the injury status suffix shown after a lineup player's name"""
+    # Don't show status for D/ST
+    if getattr(player, 'position', '') in DST_POSITIONS:
+        return ''
+    return LINEUP_STATUS_SUFFIXES.get(getattr(player, 'injuryStatus', None), '')
+
+def get_roster_summary(team):
+    """Get a team's starters, bench and starting position counts, built once per team object"""
+    summary = getattr(team, '_roster_summary', None)
+    if summary is None:
+        # Partition the roster and count starting positions in a single pass
+        starters, bench, position_counts = [], [], {}
+        for player in team.roster:
+            if getattr(player, 'lineupSlot', None) == "BE":
+                bench.append(player)
+            else:
+                starters.append(player)
+                pos = getattr(player, 'position', 'UNKNOWN')
+                position_counts[pos] = position_counts.get(pos, 0) + 1
+        summary = {'starters': starters, 'bench': bench, 'position_counts': position_counts}
+        team._roster_summary = summary
+    return summary
+
+def find_user_league(user_leagues, league_name):
+    """Find one of a user's leagues by name (case-insensitive), returning (league_info, league_key)"""
+    search_name = league_name.lower()
+    league_info = next((li for li in user_leagues if li['name'].lower() == search_name), None)
+    if league_info is None:
+        return None, None
+    return league_info, f"{league_info['league_id']}_{league_info['owner_id']}"
 
 def validate_player_name(player_name):
     """Validate and sanitize player name input"""
@@ -459,8 +647,6 @@ _league_cache = {}
 
 def get_cached_league_data(cache_key, fetch_function, cache_duration_seconds=300):
     """Cache league data to avoid repeated API calls within 5 minutes"""
-    import time
-
     current_time = time.time()
 
     if cache_key in _league_cache:
@@ -468,18 +654,49 @@ def get_cached_league_data(cache_key, fetch_function, cache_duration_seconds=300
         if current_time - timestamp < cache_duration_seconds:
             return cached_data
 
-    # Fetch fresh data
+    # Fetch fresh data - failed fetches (None) are not cached so the next call retries
     data = fetch_function()
-    _league_cache[cache_key] = (data, current_time)
+    if data is not None:
+        _league_cache[cache_key] = (data, current_time)
     return data
 
 def safe_field_value(text, max_length=DISCORD_EMBED_CHAR_LIMIT):
     """Safely truncate text to fit Discord embed field limits"""
-    if len(text) <= max_length:
-        return text
-
-    # Truncate and add ellipsis
-    return text[:max_length-3] + "..."
+    # Truncate and add ellipsis only when the text is too long
+    return text if len(text) <= max_length else text[:max_length-3] + "..."
+
+def extract_display_name(owner_data):
+    """Walk ESPN owner data (dict, list of owners, or string) and return a display name or None"""
+    if isinstance(owner_data, str):
+        return owner_data
+    if isinstance(owner_data, dict):
+        return (owner_data.get('displayName') or
+                f"{owner_data.get('firstName', '')} {owner_data.get('lastName', '')}".strip() or
+                owner_data.get('id'))
+    if isinstance(owner_data, list) and owner_data:
+        # Handle list of owners - use the first one
+        first_owner = owner_data[0]
+        return extract_display_name(first_owner) if isinstance(first_owner, (dict, list)) else str(first_owner)
+    return getattr(owner_data, 'displayName', None)
+
+def calculate_score_stats(weekly_scores):
+    """Return (total, games, average, consistency, high, low) for a list of played weekly scores"""
+    games_played = len(weekly_scores)
+    if not games_played:
+        return 0, 0, 0, 100, 0, 0
+
+    total_points = sum(weekly_scores)
+    avg_points = total_points / games_played
+
+    # Consistency (lower std dev = more consistent)
+    if games_played > 1:
+        variance = sum(score * score for score in weekly_scores) / games_played - avg_points * avg_points
+        std_dev = max(variance, 0) ** 0.5
+        consistency = max(0, 100 - (std_dev / avg_points) * 100) if avg_points > 0 else 0
+    else:
+        consistency = 100
+
+    return total_points, games_played, avg_points, consistency, max(weekly_scores), min(weekly_scores)
 
 async def handle_command_error(interaction, error, command_name="command"):
     """Consistent error handling for Discord commands"""
@@ -520,7 +737,6 @@ async def on_ready():
 
 @client.tree.command(name="ping", description="Check if the bot is alive.")
 async def ping(interaction: discord.Interaction):
-    import time
     start_time = time.time()
 
     embed = discord.Embed(
@@ -573,20 +789,10 @@ async def team(interaction: discord.Interaction, team_name: str):
         except Exception as api_error:
             await interaction.followup.send(f"ESPN API error: {api_error}")
             return
-        team = next((t for t in league.teams if t.team_name.lower() == team_name.lower()), None)
+        team = get_team_name_index(league).get(team_name.lower())
         if not team:
             await interaction.followup.send(f"Team '{team_name}' not found.")
             return
-        # Single-width emoji mappings
-        pos_emoji = {
-            'QB': '🏈', 'RB': '🏃', 'WR': '🏃', 'TE': '🧩', 'K': '🦶', 'D/ST': '🛡️', 'DST': '🛡️', 'DEF': '🛡️', 'Bench': '🪑', 'BE': '🪑', 'IR': '🏥'
-        }
-        status_emoji = {
-            'ACTIVE': '✅', 'QUESTIONABLE': '⚠️', 'OUT': '❌', 'INJURY_RESERVE': '🏥', 'NORMAL': '🔵', None: ''
-        }
-        status_abbrev = {
-            'ACTIVE': 'A', 'QUESTIONABLE': 'Q', 'OUT': 'O', 'INJURY_RESERVE': 'IR', 'NORMAL': 'N', None: ''
-        }
         # ESPN lineup slot order for sorting
         slot_order = {
             'QB': 0, 'RB': 1, 'RB2': 2, 'WR': 3, 'WR2': 4, 'TE': 5, 'FLEX': 6, 'D/ST': 7, 'DST': 7, 'K': 8
@@ -632,14 +838,14 @@ async def team(interaction: discord.Interaction, team_name: str):
         def get_status(player):
             # Don't show status for D/ST positions
             pos = getattr(player, 'position', '')
-            if pos in ['D/ST', 'DST', 'DEF']:
+            if pos in DST_POSITIONS:
                 return ''
 
             status = getattr(player, 'injuryStatus', None)
-            abbrev = status_abbrev.get(status, status_abbrev.get('NORMAL', ''))
+            abbrev = ROSTER_STATUS_ABBREVS.get(status, ROSTER_STATUS_ABBREVS['NORMAL'])
 
             # Don't show status for Available players (A or N)
-            if abbrev in ['A', 'N']:
+            if abbrev in HIDDEN_STATUS_ABBREVS:
                 return ''
 
             return abbrev
@@ -831,16 +1037,8 @@ async def player(interaction: discord.Interaction, player_name: str):
         def get_points(player):
             return get_current_week_points(player, league)
         
-        def get_proj(player):
-            return (
-                getattr(player, 'projected_points', None)
-                or getattr(player, 'projected_total_points', None)
-                or getattr(player, 'proj_score', None)
-                or 'N/A'
-            )
-        
         actual_points = get_points(found_player)
-        proj_points = get_proj(found_player)
+        proj_points = get_projected_points(found_player)
         season_total = getattr(found_player, 'total_points', 'N/A')
         injury_status = getattr(found_player, 'injuryStatus', 'N/A')
         nfl_team = getattr(found_player, 'proTeam', 'N/A')
@@ -943,8 +1141,8 @@ async def compare(interaction: discord.Interaction, team1: str, team2: str):
             league = League(league_id=LEAGUE_ID, year=SEASON_ID)
         
         # Find both teams
-        team1_obj = next((t for t in league.teams if t.team_name.lower() == team1.lower()), None)
-        team2_obj = next((t for t in league.teams if t.team_name.lower() == team2.lower()), None)
+        team1_obj = get_team_name_index(league).get(team1.lower())
+        team2_obj = get_team_name_index(league).get(team2.lower())
         
         if not team1_obj:
             await interaction.followup.send(f"Team '{team1}' not found.")
@@ -1095,7 +1293,7 @@ async def standings(interaction: discord.Interaction):
             })
 
         # Sort teams by win percentage (descending), then by points for (descending)
-        teams_data.sort(key=lambda x: (x['win_pct'], x['points_for']), reverse=True)
+        teams_data.sort(key=itemgetter('win_pct', 'points_for'), reverse=True)
 
         # Create standings table
         current_week = getattr(league, 'current_week', 'Unknown')
@@ -1120,8 +1318,8 @@ async def standings(interaction: discord.Interaction):
         embed.add_field(name="📊 Current Standings", value=standings_table, inline=False)
 
         # Add some league stats
-        highest_scoring = max(teams_data, key=lambda x: x['points_for']) if teams_data else None
-        lowest_scoring = min(teams_data, key=lambda x: x['points_for']) if teams_data else None
+        highest_scoring = max(teams_data, key=itemgetter('points_for')) if teams_data else None
+        lowest_scoring = min(teams_data, key=itemgetter('points_for')) if teams_data else None
 
         # Find highest single weekly score across all teams and weeks
         highest_weekly_score = 0.0
@@ -1259,10 +1457,11 @@ async def stats(interaction: discord.Interaction):
                 team_data['std_dev'] = 0
                 team_data['avg_weekly'] = weekly_scores[0] if weekly_scores else 0
 
-            # Calculate efficiency (wins per point)
+            # Calculate win percentage once (None before any games) and efficiency (wins per point)
             total_games = team_data['wins'] + team_data['losses'] + team_data['ties']
-            if total_games > 0 and team_data['points_for'] > 0:
-                win_pct = (team_data['wins'] + team_data['ties'] * 0.5) / total_games
+            win_pct = (team_data['wins'] + team_data['ties'] * 0.5) / total_games if total_games > 0 else None
+            team_data['win_pct'] = win_pct
+            if win_pct is not None and team_data['points_for'] > 0:
                 team_data['efficiency'] = win_pct / (team_data['points_for'] / 1000)  # Normalize points
             else:
                 team_data['efficiency'] = 0
@@ -1275,8 +1474,8 @@ async def stats(interaction: discord.Interaction):
 
         # 1. Consistency/Volatility
         if teams_analytics:
-            most_consistent = min(teams_analytics, key=lambda x: x['std_dev'])
-            most_volatile = max(teams_analytics, key=lambda x: x['std_dev'])
+            most_consistent = min(teams_analytics, key=itemgetter('std_dev'))
+            most_volatile = max(teams_analytics, key=itemgetter('std_dev'))
 
             consistency_text = f"""```
 Most Consistent Team (Low Variance)
@@ -1294,8 +1493,8 @@ Most Volatile Team (High Variance)
                 all_weekly_scores.append((score, team['name']))
 
         if all_weekly_scores:
-            highest_weekly = max(all_weekly_scores, key=lambda x: x[0])
-            lowest_weekly = min(all_weekly_scores, key=lambda x: x[0])
+            highest_weekly = max(all_weekly_scores, key=itemgetter(0))
+            lowest_weekly = min(all_weekly_scores, key=itemgetter(0))
 
             extremes_text = f"""```
 Best Single Week Performance
@@ -1311,12 +1510,12 @@ Worst Single Week Performance
         unlucky_teams = []
         efficient_teams = []
 
+        # Calculate expected wins based on points scored vs league average
+        avg_league_points = sum(t['points_for'] for t in teams_analytics) / len(teams_analytics) if teams_analytics else 0
+
         for team in teams_analytics:
-            total_games = team['wins'] + team['losses'] + team['ties']
-            if total_games > 0:
-                win_pct = (team['wins'] + team['ties'] * 0.5) / total_games
-                # Calculate expected wins based on points scored vs league average
-                avg_league_points = sum(t['points_for'] for t in teams_analytics) / len(teams_analytics)
+            win_pct = team['win_pct']
+            if win_pct is not None:
                 if team['points_for'] > avg_league_points and win_pct < 0.5:
                     unlucky_teams.append((team, win_pct, team['points_for']))
 
@@ -1326,7 +1525,7 @@ Worst Single Week Performance
         luck_lines = []
 
         if efficient_teams:
-            most_efficient = max(efficient_teams, key=lambda x: x[1])
+            most_efficient = max(efficient_teams, key=itemgetter(1))
             luck_lines.append(f"⚡ {most_efficient[0]['name']:<25} {most_efficient[2]:.1%} win rate")
 
         if unlucky_teams:
@@ -1334,8 +1533,8 @@ Worst Single Week Performance
             luck_lines.append(f"😭 {unluckiest[0]['name']:<25} {unluckiest[1]:.1%} wins ({unluckiest[2]:.1f} pts)")
 
         # Schedule difficulty
-        toughest_schedule = max(teams_analytics, key=lambda x: x['points_against'])
-        easiest_schedule = min(teams_analytics, key=lambda x: x['points_against'])
+        toughest_schedule = max(teams_analytics, key=itemgetter('points_against'))
+        easiest_schedule = min(teams_analytics, key=itemgetter('points_against'))
 
         schedule_lines = [
             f"💪 {toughest_schedule['name']:<25} {toughest_schedule['points_against']:.1f} PA",
@@ -1481,7 +1680,7 @@ async def sleeper(interaction: discord.Interaction, position: str = None):
                         })
 
         # Sort by sleeper score
-        sleeper_candidates.sort(key=lambda x: x['sleeper_score'], reverse=True)
+        sleeper_candidates.sort(key=itemgetter('sleeper_score'), reverse=True)
 
         # Create embed
         pos_filter = f" ({position.upper()})" if position else ""
@@ -1529,11 +1728,11 @@ async def sleeper(interaction: discord.Interaction, position: str = None):
 
             # Add insights
             insights = []
-            high_proj_count = len([s for s in sleeper_candidates if s['projected'] >= 15])
+            high_proj_count = sum(1 for s in sleeper_candidates if s['projected'] >= 15)
             if high_proj_count > 0:
                 insights.append(f"🔥 {high_proj_count} players projected for 15+ pts")
 
-            low_owned_count = len([s for s in sleeper_candidates if s.get('ownership', 100) < 25])
+            low_owned_count = sum(1 for s in sleeper_candidates if s['ownership'] < 25)
             if low_owned_count > 0:
                 insights.append(f"💎 {low_owned_count} players under 25% ownership")
 
@@ -1562,7 +1761,7 @@ async def matchup(interaction: discord.Interaction, team1: str, team2: str = Non
             return
 
         # Find first team
-        team1_obj = next((t for t in league.teams if t.team_name.lower() == team1.lower()), None)
+        team1_obj = get_team_name_index(league).get(team1.lower())
         if not team1_obj:
             await interaction.followup.send(f"Team '{team1}' not found.")
             return
@@ -1596,7 +1795,7 @@ async def matchup(interaction: discord.Interaction, team1: str, team2: str = Non
 
         if not team2_obj:
             if team2:
-                team2_obj = next((t for t in league.teams if t.team_name.lower() == team2.lower()), None)
+                team2_obj = get_team_name_index(league).get(team2.lower())
                 if not team2_obj:
                     await interaction.followup.send(f"Team '{team2}' not found.")
                     return
@@ -1605,23 +1804,9 @@ async def matchup(interaction: discord.Interaction, team1: str, team2: str = Non
                 return
 
         # Helper functions for data extraction
-        def get_actual_points(player, league_ref):
-            """Get actual points for current week"""
-            try:
-                current_week = getattr(league_ref, 'current_week', 1)
-                if hasattr(player, 'stats') and player.stats:
-                    week_stats = player.stats.get(current_week, {})
-                    actual_points = week_stats.get('points', None)
-                    if actual_points is not None and actual_points > 0:
-                        return actual_points
-            except:
-                pass
-            return 0
-
-        def get_weekly_projected(player, league_ref):
+        def get_weekly_projected(player, current_week):
             """Get weekly projected points"""
             try:
-                current_week = getattr(league_ref, 'current_week', 1)
                 if hasattr(player, 'stats') and player.stats:
                     week_stats = player.stats.get(current_week, {})
                     projected = week_stats.get('projected_points', None)
@@ -1636,58 +1821,40 @@ async def matchup(interaction: discord.Interaction, team1: str, team2: str = Non
                 pass
             return 0
 
-        def get_player_status(player):
-            """Get injury status"""
-            status_abbrev = {
-                'ACTIVE': '', 'QUESTIONABLE': 'Q', 'OUT': 'O', 'INJURY_RESERVE': 'IR', 'NORMAL': '', None: ''
-            }
-            # Don't show status for D/ST
-            pos = getattr(player, 'position', '')
-            if pos in ['D/ST', 'DST', 'DEF']:
-                return ''
-
-            status = getattr(player, 'injuryStatus', None)
-            abbrev = status_abbrev.get(status, '')
-            return f" ({abbrev})" if abbrev else ''
-
         # Get lineup data for both teams
         def get_lineup_with_scores(team):
             starters = [p for p in team.roster if getattr(p, 'lineupSlot', None) != "BE"]
 
-            # Group by position with proper ordering
-            position_order = ['QB', 'RB', 'WR', 'TE', 'FLEX', 'K', 'D/ST', 'DST']
             lineup_data = []
 
             # Sort players by lineup slot order
-            def get_position_priority(player):
-                pos = getattr(player, 'position', 'FLEX')
-                return position_order.index(pos) if pos in position_order else 99
-
             starters_sorted = sorted(starters, key=get_position_priority)
+            # The week is the same for every player on the team
+            current_week = getattr(league, 'current_week', 1)
+            actual_total = 0
+            proj_total = 0
 
             for player in starters_sorted:
                 pos = getattr(player, 'position', 'FLEX')
-                actual = get_actual_points(player, league)
-                projected = get_weekly_projected(player, league)
+                actual = get_week_actual_points(player, current_week)
+                projected = get_weekly_projected(player, current_week)
                 status = get_player_status(player)
+                actual_total += actual
+                proj_total += projected
 
+                # Truncate once here so the table renderer can use the values as-is
                 lineup_data.append({
-                    'position': pos,
-                    'name': player.name + status,
+                    'position': pos[:3],
+                    'name': (player.name + status)[:15],  # Shorten to prevent overflow
                     'actual': actual,
                     'projected': projected
                 })
 
-            return lineup_data
-
-        team1_lineup = get_lineup_with_scores(team1_obj)
-        team2_lineup = get_lineup_with_scores(team2_obj)
+            return lineup_data, actual_total, proj_total
 
-        # Calculate totals
-        team1_actual_total = sum(p['actual'] for p in team1_lineup)
-        team1_proj_total = sum(p['projected'] for p in team1_lineup)
-        team2_actual_total = sum(p['actual'] for p in team2_lineup)
-        team2_proj_total = sum(p['projected'] for p in team2_lineup)
+        # Lineups come back with their actual/projected totals already summed
+        team1_lineup, team1_actual_total, team1_proj_total = get_lineup_with_scores(team1_obj)
+        team2_lineup, team2_actual_total, team2_proj_total = get_lineup_with_scores(team2_obj)
 
         # Create simple side-by-side comparison: "QB Dak Prescott 0.0 | 0.0 Lamar Jackson QB"
         matchup_lines = []
@@ -1699,8 +1866,8 @@ async def matchup(interaction: discord.Interaction, team1: str, team2: str = Non
             # Team 1 player data
             if i < len(team1_lineup):
                 p1 = team1_lineup[i]
-                pos1 = p1['position'][:3]
-                name1 = p1['name'][:15]  # Shorten to prevent overflow
+                pos1 = p1['position']
+                name1 = p1['name']
                 actual1 = f"{p1['actual']:.1f}"
             else:
                 pos1 = name1 = actual1 = ""
@@ -1708,8 +1875,8 @@ async def matchup(interaction: discord.Interaction, team1: str, team2: str = Non
             # Team 2 player data
             if i < len(team2_lineup):
                 p2 = team2_lineup[i]
-                pos2 = p2['position'][:3]
-                name2 = p2['name'][:15]  # Shorten to prevent overflow
+                pos2 = p2['position']
+                name2 = p2['name']
                 actual2 = f"{p2['actual']:.1f}"
             else:
                 pos2 = name2 = actual2 = ""
@@ -1732,28 +1899,10 @@ async def matchup(interaction: discord.Interaction, team1: str, team2: str = Non
                 line = f"{left_side} | {right_side}"
                 matchup_lines.append(line)
 
-        # Add totals row with proper spacing - create divider by measuring actual content
+        # Add totals row - divider and total format match the player row widths
         if matchup_lines:
-            # Create a sample line to measure exact positioning
-            sample_left = f"{'XXX':<3} {'XXXXXXXXXXXXXXX':<15} {'99.9':>5}"
-            sample_right = f"{'99.9':<5} {'XXXXXXXXXXXXXXX':<15} {'XXX':>3}"
-            sample_line = f"{sample_left} | {sample_right}"
-
-            # Find pipe position in sample line
-            pipe_pos = sample_line.find(' | ')
-
-            # Create divider that matches exactly
-            divider_left = '-' * pipe_pos
-            divider_right = '-' * (len(sample_line) - pipe_pos - 3)  # -3 for ' | '
-            divider_line = f"{divider_left} | {divider_right}"
-            matchup_lines.append(divider_line)
-
-            # Left total: formatted exactly like player rows
-            left_total = f"{'TOT':<3} {'TOTAL':<15} {team1_actual_total:>5.1f}"
-            # Right total: formatted exactly like player rows
-            right_total = f"{team2_actual_total:<5.1f} {'TOTAL':<15} {'TOT':>3}"
-            total_line = f"{left_total} | {right_total}"
-            matchup_lines.append(total_line)
+            matchup_lines.append(MATCHUP_DIVIDER_LINE)
+            matchup_lines.append(MATCHUP_TOTAL_FORMAT.format(team1_actual_total, team2_actual_total))
 
         # Create embed
         embed = discord.Embed(
@@ -1767,32 +1916,16 @@ async def matchup(interaction: discord.Interaction, team1: str, team2: str = Non
         embed.add_field(name=f"🔴 {team2_obj.team_name}", value=f"**{team2_actual_total:.1f}** actual | **{team2_proj_total:.1f}** projected", inline=True)
 
         # Player comparison table - split into chunks to avoid Discord 1024 char limit
-        full_table = chr(10).join(matchup_lines)
-
-        # Split into manageable chunks (Discord limit is 1024 chars per field)
         chunk_size = 900  # Leave room for code block formatting
-        table_chunks = []
-
-        if len(full_table) <= chunk_size:
-            table_chunks.append(full_table)
-        else:
-            # Split by lines to keep formatting intact
-            lines = matchup_lines
-            current_chunk = []
-            current_length = 0
-
-            for line in lines:
-                line_length = len(line) + 1  # +1 for newline
-                if current_length + line_length > chunk_size and current_chunk:
-                    table_chunks.append(chr(10).join(current_chunk))
-                    current_chunk = [line]
-                    current_length = line_length
-                else:
-                    current_chunk.append(line)
-                    current_length += line_length
 
-            if current_chunk:
-                table_chunks.append(chr(10).join(current_chunk))
+        # Rows are fixed-width (never wider than the divider), so the number of
+        # rows per chunk is known up front and the table can be sliced directly
+        row_length = len(MATCHUP_DIVIDER_LINE) + 1  # +1 for newline
+        rows_per_chunk = max(1, chunk_size // row_length)
+        table_chunks = [
+            chr(10).join(matchup_lines[i:i + rows_per_chunk])
+            for i in range(0, len(matchup_lines), rows_per_chunk)
+        ]
 
         # Add table chunks as separate fields with team headers
         for i, chunk in enumerate(table_chunks):
@@ -1870,18 +2003,20 @@ async def waiver(interaction: discord.Interaction, position: str = None, min_own
             filter_pos = 'D/ST' if position == 'DST' else position
             free_agents = [p for p in free_agents if p.position == filter_pos]
 
-        # Filter by ownership percentage
+        # Filter by ownership percentage in a single pass - projections are only
+        # looked up for players inside the ownership window
         filtered_agents = []
         for player in free_agents:
             ownership = getattr(player, 'percent_owned', 0)
-            if min_owned <= ownership <= max_owned:
-                projected = get_current_week_points(player, league)
-                if projected and projected > 0:
-                    filtered_agents.append({
-                        'player': player,
-                        'projected': projected,
-                        'ownership': ownership
-                    })
+            if not min_owned <= ownership <= max_owned:
+                continue
+            projected = get_current_week_points(player, league)
+            if isinstance(projected, (int, float)) and projected > 0:
+                filtered_agents.append({
+                    'player': player,
+                    'projected': projected,
+                    'ownership': ownership
+                })
 
         if not filtered_agents:
             filter_desc = f" (position: {position})" if position else ""
@@ -1889,11 +2024,8 @@ async def waiver(interaction: discord.Interaction, position: str = None, min_own
             await interaction.followup.send(f"No available players found with current filters{filter_desc}.", ephemeral=True)
             return
 
-        # Sort by projected points
-        filtered_agents.sort(key=lambda x: x['projected'], reverse=True)
-
-        # Take top 15 for display
-        top_pickups = filtered_agents[:15]
+        # Take top 15 by projected points for display (no need to sort the full list)
+        top_pickups = heapq.nlargest(15, filtered_agents, key=itemgetter('projected'))
 
         # Create embed
         league_name = get_league_name(user_id=interaction.user.id)
@@ -1913,7 +2045,7 @@ async def waiver(interaction: discord.Interaction, position: str = None, min_own
 
         for i, pickup in enumerate(top_pickups, 1):
             player = pickup['player']
-            name = player.name[:20] if len(player.name) > 20 else player.name
+            name = player.name[:20]
             pos = player.position
             proj = pickup['projected']
             own = pickup['ownership']
@@ -1941,12 +2073,9 @@ async def waiver(interaction: discord.Interaction, position: str = None, min_own
             # Position-specific advice
             if not position:
                 # Count by position
-                pos_counts = {}
+                pos_counts = defaultdict(list)
                 for pickup in top_pickups[:10]:  # Top 10 only
-                    pos = pickup['player'].position
-                    if pos not in pos_counts:
-                        pos_counts[pos] = []
-                    pos_counts[pos].append(pickup)
+                    pos_counts[pickup['player'].position].append(pickup)
 
                 # Find position with most depth
                 if pos_counts:
@@ -2013,11 +2142,11 @@ async def trade(interaction: discord.Interaction, team1: str, team2: str, team1_
                 team2_obj = team
 
         if not team1_obj:
-            await interaction.followup.send(f"Team '{team1}' not found. Available teams: {', '.join(t.team_name for t in league.teams)}", ephemeral=True)
+            await interaction.followup.send(f"Team '{team1}' not found. Available teams: {get_team_names_text(league)}", ephemeral=True)
             return
 
         if not team2_obj:
-            await interaction.followup.send(f"Team '{team2}' not found. Available teams: {', '.join(t.team_name for t in league.teams)}", ephemeral=True)
+            await interaction.followup.send(f"Team '{team2}' not found. Available teams: {get_team_names_text(league)}", ephemeral=True)
             return
 
         # Parse player names
@@ -2069,11 +2198,28 @@ async def trade(interaction: discord.Interaction, team1: str, team2: str, team1_
         team1_values = [get_player_value(p) for p in team1_trade_players]
         team2_values = [get_player_value(p) for p in team2_trade_players]
 
-        # Calculate totals
-        team1_proj_total = sum(p['projected'] for p in team1_values)
-        team2_proj_total = sum(p['projected'] for p in team2_values)
-        team1_avg_total = sum(p['avg_points'] for p in team1_values)
-        team2_avg_total = sum(p['avg_points'] for p in team2_values)
+        # Summarize each side in a single pass: totals, position totals, trade lines and injuries
+        def summarize_trade_side(player_values):
+            proj_total = 0
+            avg_total = 0
+            pos_totals = defaultdict(float)
+            gives = []
+            injuries = []
+
+            for player_val in player_values:
+                proj_total += player_val['projected']
+                avg_total += player_val['avg_points']
+                pos_totals[player_val['position']] += player_val['projected']
+                gives.append(f"{player_val['position']} {player_val['name']} ({player_val['projected']:.1f} pts)")
+
+                injury_status = getattr(player_val['player'], 'injuryStatus', None)
+                if injury_status and injury_status not in HEALTHY_INJURY_STATUSES:
+                    injuries.append(f"{player_val['name']} ({injury_status})")
+
+            return proj_total, avg_total, pos_totals, gives, injuries
+
+        team1_proj_total, team1_avg_total, team1_pos_totals, team1_gives, team1_injuries = summarize_trade_side(team1_values)
+        team2_proj_total, team2_avg_total, team2_pos_totals, team2_gives, team2_injuries = summarize_trade_side(team2_values)
 
         # Create embed
         league_name = get_league_name(user_id=interaction.user.id)
@@ -2083,100 +2229,53 @@ async def trade(interaction: discord.Interaction, team1: str, team2: str, team1_
             color=0x4169E1
         )
 
-        # Trade details
-        team1_gives = []
-        team2_gives = []
-
-        for player_val in team1_values:
-            team1_gives.append(f"{player_val['position']} {player_val['name']} ({player_val['projected']:.1f} pts)")
-
-        for player_val in team2_values:
-            team2_gives.append(f"{player_val['position']} {player_val['name']} ({player_val['projected']:.1f} pts)")
-
-        embed.add_field(
-            name=f"📤 {team1_obj.team_name} Gives",
-            value="\n".join(team1_gives) if team1_gives else "None",
-            inline=True
-        )
-
-        embed.add_field(
-            name=f"📥 {team1_obj.team_name} Gets",
-            value="\n".join(team2_gives) if team2_gives else "None",
-            inline=True
-        )
-
-        embed.add_field(name="\u200b", value="\u200b", inline=True)  # Spacer
+        # Trade details - one field per team covering what it gives and gets
+        team1_gives_text = ", ".join(team1_gives) if team1_gives else "None"
+        team2_gives_text = ", ".join(team2_gives) if team2_gives else "None"
 
         embed.add_field(
-            name=f"📤 {team2_obj.team_name} Gives",
-            value="\n".join(team2_gives) if team2_gives else "None",
+            name=f"🔄 {team1_obj.team_name}",
+            value=safe_field_value(f"📤 **Gives:** {team1_gives_text}\n📥 **Gets:** {team2_gives_text}"),
             inline=True
         )
 
         embed.add_field(
-            name=f"📥 {team2_obj.team_name} Gets",
-            value="\n".join(team1_gives) if team1_gives else "None",
+            name=f"🔄 {team2_obj.team_name}",
+            value=safe_field_value(f"📤 **Gives:** {team2_gives_text}\n📥 **Gets:** {team1_gives_text}"),
             inline=True
         )
 
-        embed.add_field(name="\u200b", value="\u200b", inline=True)  # Spacer
-
         # Trade value comparison
-        value_lines = []
-        value_lines.append(f"**Projected Points (This Week)**")
-        value_lines.append(f"• {team1_obj.team_name}: {team1_proj_total:.1f} pts")
-        value_lines.append(f"• {team2_obj.team_name}: {team2_proj_total:.1f} pts")
-        proj_diff = abs(team1_proj_total - team2_proj_total)
-
-        if team1_proj_total > team2_proj_total:
-            value_lines.append(f"• **Edge**: {team1_obj.team_name} (+{proj_diff:.1f})")
-        elif team2_proj_total > team1_proj_total:
-            value_lines.append(f"• **Edge**: {team2_obj.team_name} (+{proj_diff:.1f})")
-        else:
-            value_lines.append(f"• **Edge**: Even trade")
-
-        value_lines.append("")
-        value_lines.append(f"**Season Average (Per Game)**")
-        value_lines.append(f"• {team1_obj.team_name}: {team1_avg_total:.1f} pts")
-        value_lines.append(f"• {team2_obj.team_name}: {team2_avg_total:.1f} pts")
-        avg_diff = abs(team1_avg_total - team2_avg_total)
-
-        if team1_avg_total > team2_avg_total:
-            value_lines.append(f"• **Edge**: {team1_obj.team_name} (+{avg_diff:.1f})")
-        elif team2_avg_total > team1_avg_total:
-            value_lines.append(f"• **Edge**: {team2_obj.team_name} (+{avg_diff:.1f})")
-        else:
-            value_lines.append(f"• **Edge**: Even trade")
+        def edge_line(team1_total, team2_total):
+            diff = abs(team1_total - team2_total)
+            if team1_total > team2_total:
+                return f"• **Edge**: {team1_obj.team_name} (+{diff:.1f})"
+            elif team2_total > team1_total:
+                return f"• **Edge**: {team2_obj.team_name} (+{diff:.1f})"
+            return "• **Edge**: Even trade"
+
+        value_lines = [
+            "**Projected Points (This Week)**",
+            f"• {team1_obj.team_name}: {team1_proj_total:.1f} pts",
+            f"• {team2_obj.team_name}: {team2_proj_total:.1f} pts",
+            edge_line(team1_proj_total, team2_proj_total),
+            "",
+            "**Season Average (Per Game)**",
+            f"• {team1_obj.team_name}: {team1_avg_total:.1f} pts",
+            f"• {team2_obj.team_name}: {team2_avg_total:.1f} pts",
+            edge_line(team1_avg_total, team2_avg_total),
+        ]
 
         embed.add_field(name="📊 Value Comparison", value="\n".join(value_lines), inline=False)
 
         # Position analysis
         position_analysis = []
 
-        # Group by positions
-        team1_positions = {}
-        team2_positions = {}
-
-        for player_val in team1_values:
-            pos = player_val['position']
-            if pos not in team1_positions:
-                team1_positions[pos] = []
-            team1_positions[pos].append(player_val)
-
-        for player_val in team2_values:
-            pos = player_val['position']
-            if pos not in team2_positions:
-                team2_positions[pos] = []
-            team2_positions[pos].append(player_val)
-
-        all_positions = set(team1_positions.keys()) | set(team2_positions.keys())
+        all_positions = team1_pos_totals.keys() | team2_pos_totals.keys()
 
         for pos in sorted(all_positions):
-            team1_pos_players = team1_positions.get(pos, [])
-            team2_pos_players = team2_positions.get(pos, [])
-
-            team1_pos_total = sum(p['projected'] for p in team1_pos_players)
-            team2_pos_total = sum(p['projected'] for p in team2_pos_players)
+            team1_pos_total = team1_pos_totals.get(pos, 0)
+            team2_pos_total = team2_pos_totals.get(pos, 0)
 
             if team1_pos_total > 0 or team2_pos_total > 0:
                 if team1_pos_total > team2_pos_total:
@@ -2192,32 +2291,27 @@ async def trade(interaction: discord.Interaction, team1: str, team2: str, team1_
             embed.add_field(name="🎯 Position Analysis", value="\n".join(position_analysis), inline=False)
 
         # Trade recommendation
-        recommendation_lines = []
-
         # Overall fairness
         total_diff = abs((team1_proj_total + team1_avg_total) - (team2_proj_total + team2_avg_total))
         if total_diff <= 2:
-            recommendation_lines.append("✅ **Fairness**: Very fair trade")
+            fairness_line = "✅ **Fairness**: Very fair trade"
         elif total_diff <= 5:
-            recommendation_lines.append("⚖️ **Fairness**: Reasonably fair trade")
+            fairness_line = "⚖️ **Fairness**: Reasonably fair trade"
         elif total_diff <= 10:
-            recommendation_lines.append("⚠️ **Fairness**: Slightly uneven trade")
+            fairness_line = "⚠️ **Fairness**: Slightly uneven trade"
         else:
-            recommendation_lines.append("❌ **Fairness**: Significantly uneven trade")
+            fairness_line = "❌ **Fairness**: Significantly uneven trade"
 
         # Win-win analysis
-        if len(set(p['position'] for p in team1_values)) != len(set(p['position'] for p in team2_values)):
-            recommendation_lines.append("🔄 **Type**: Position diversification trade")
+        if len(team1_pos_totals) != len(team2_pos_totals):
+            type_line = "🔄 **Type**: Position diversification trade"
         else:
-            recommendation_lines.append("🔄 **Type**: Like-for-like position trade")
+            type_line = "🔄 **Type**: Like-for-like position trade"
 
-        # Risk assessment
-        injury_concerns = []
-        for player_val in team1_values + team2_values:
-            injury_status = getattr(player_val['player'], 'injuryStatus', None)
-            if injury_status and injury_status not in ['ACTIVE', 'NORMAL', None]:
-                injury_concerns.append(f"{player_val['name']} ({injury_status})")
+        recommendation_lines = [fairness_line, type_line]
 
+        # Risk assessment
+        injury_concerns = team1_injuries + team2_injuries
         if injury_concerns:
             recommendation_lines.append(f"🏥 **Injury Risk**: {', '.join(injury_concerns)}")
 
@@ -2233,35 +2327,249 @@ async def trade(interaction: discord.Interaction, team1: str, team2: str, team1_
         else:
             await interaction.followup.send(error_msg, ephemeral=True)
 
-@client.tree.command(name="menu", description="Interactive command menu for easy navigation.")
-async def menu(interaction: discord.Interaction):
-    """Main interactive menu for bot commands"""
-    embed = discord.Embed(
-        title="🏈 Fantasy Football Command Center",
-        description="Select a category to explore available commands",
-        color=0x32CD32
-    )
+# Static menu embeds - built once at import and reused by every menu interaction
+MAIN_MENU_EMBED = discord.Embed(
+    title="🏈 Fantasy Football Command Center",
+    description="Select a category to explore available commands",
+    color=0x32CD32
+).add_field(
+    name="📊 Team Analytics",
+    value="• Team rosters & stats\n• Compare teams\n• Weekly matchups\n• League standings",
+    inline=True
+).add_field(
+    name="🎯 Strategy Tools",
+    value="• Waiver wire analysis\n• Trade analyzer\n• Sleeper picks\n• Player stats",
+    inline=True
+).add_field(
+    name="📈 League Data",
+    value="• Season statistics\n• Performance metrics\n• Head-to-head records",
+    inline=True
+)
 
-    embed.add_field(
-        name="📊 Team Analytics",
-        value="• Team rosters & stats\n• Compare teams\n• Weekly matchups\n• League standings",
-        inline=True
-    )
+TEAM_ANALYTICS_EMBED = discord.Embed(
+    title="📊 Team Analytics Commands",
+    description="Choose a team analysis command",
+    color=0x1E90FF
+).add_field(
+    name="Available Commands",
+    value="• `/team [name]` - View team roster & player stats\n"
+          "• `/compare [team1] [team2]` - Compare two teams\n"
+          "• `/matchup [team1] [team2]` - Weekly matchup analysis\n"
+          "• `/standings` - League standings & records",
+    inline=False
+)
 
-    embed.add_field(
-        name="🎯 Strategy Tools",
-        value="• Waiver wire analysis\n• Trade analyzer\n• Sleeper picks\n• Player stats",
-        inline=True
-    )
+STRATEGY_TOOLS_EMBED = discord.Embed(
+    title="🎯 Strategy Tools",
+    description="Choose a strategy command",
+    color=0xFF6347
+).add_field(
+    name="Available Commands",
+    value="• `/waiver [position] [min_owned] [max_owned]` - Waiver wire analysis\n"
+          "• `/trade [team1] [team2] [players1] [players2]` - Trade analyzer\n"
+          "• `/sleeper [position] [min_proj] [max_owned]` - Find sleeper picks\n"
+          "• `/stats` - Advanced league statistics",
+    inline=False
+)
 
-    embed.add_field(
-        name="📈 League Data",
-        value="• Season statistics\n• Performance metrics\n• Head-to-head records",
-        inline=True
-    )
+LEAGUE_DATA_EMBED = discord.Embed(
+    title="📈 League Data Commands",
+    description="Choose a league analysis command",
+    color=0x32CD32
+).add_field(
+    name="Available Commands",
+    value="• `/standings` - Current league standings\n"
+          "• `/stats` - Detailed league statistics\n"
+          "• `/compare [team1] [team2]` - Head-to-head analysis",
+    inline=False
+)
+
+# Team Analytics command details
+TEAM_ROSTER_HELP_EMBED = discord.Embed(
+    title="👥 Team Roster Command",
+    description="View detailed team roster with player stats",
+    color=0x1E90FF
+).add_field(
+    name="Command",
+    value="`/team [team_name]`",
+    inline=False
+).add_field(
+    name="Example",
+    value="`/team Swift Nation`",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Starting lineup with projected points\n• Bench players\n• Player positions and injury status\n• Interactive buttons for filtering",
+    inline=False
+)
+
+COMPARE_TEAMS_HELP_EMBED = discord.Embed(
+    title="⚖️ Compare Teams Command",
+    description="Comprehensive team comparison analysis",
+    color=0x1E90FF
+).add_field(
+    name="Command",
+    value="`/compare [team1] [team2]`",
+    inline=False
+).add_field(
+    name="Example",
+    value="`/compare \"Swift Nation\" \"Team SoloMid\"`",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Season records and standings\n• Total points comparison\n• Head-to-head history\n• Weekly projections",
+    inline=False
+)
+
+WEEKLY_MATCHUP_HELP_EMBED = discord.Embed(
+    title="🏆 Weekly Matchup Command",
+    description="Detailed current week matchup analysis",
+    color=0x1E90FF
+).add_field(
+    name="Command",
+    value="`/matchup [team1] [team2]` (team2 optional)",
+    inline=False
+).add_field(
+    name="Example",
+    value="`/matchup \"Swift Nation\"` (auto-finds opponent)",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Position-by-position breakdown\n• Projected winner\n• Key players for each team\n• Matchup competitiveness",
+    inline=False
+)
+
+LEAGUE_STANDINGS_HELP_EMBED = discord.Embed(
+    title="🏅 League Standings Command",
+    description="Current league standings and team records",
+    color=0x1E90FF
+).add_field(
+    name="Command",
+    value="`/standings`",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Team rankings and records\n• Points for/against\n• Highest/lowest scoring teams\n• Best weekly performances",
+    inline=False
+)
+
+# Strategy Tools command details
+WAIVER_WIRE_HELP_EMBED = discord.Embed(
+    title="🎯 Waiver Wire Command",
+    description="Analyze available free agents for pickup opportunities",
+    color=0xFF6347
+).add_field(
+    name="Command",
+    value="`/waiver [position] [min_owned] [max_owned]`",
+    inline=False
+).add_field(
+    name="Example",
+    value="`/waiver RB 0 25` (RBs owned by 0-25% of leagues)",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Top available players by projection\n• Hidden gems (low ownership, high points)\n• Position depth analysis\n• Ownership insights",
+    inline=False
+)
+
+TRADE_ANALYZER_HELP_EMBED = discord.Embed(
+    title="🤝 Trade Analyzer Command",
+    description="Comprehensive analysis of potential trades",
+    color=0xFF6347
+).add_field(
+    name="Command",
+    value="`/trade [team1] [team2] [team1_players] [team2_players]`",
+    inline=False
+).add_field(
+    name="Example",
+    value="`/trade \"Swift Nation\" \"Team SoloMid\" \"Lamar Jackson\" \"Josh Allen\"`",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Projected points comparison\n• Season average analysis\n• Trade fairness assessment\n• Position analysis\n• Injury risk evaluation",
+    inline=False
+)
+
+SLEEPER_PICKS_HELP_EMBED = discord.Embed(
+    title="😴 Sleeper Picks Command",
+    description="Find undervalued players with upside potential",
+    color=0xFF6347
+).add_field(
+    name="Command",
+    value="`/sleeper [position] [min_projection] [max_owned]`",
+    inline=False
+).add_field(
+    name="Example",
+    value="`/sleeper WR 8 15` (WRs with 8+ pts, <15% owned)",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• High-upside, low-owned players\n• Breakout candidate analysis\n• Value vs. ownership comparison\n• Position-specific sleepers",
+    inline=False
+)
+
+LEAGUE_STATS_HELP_EMBED = discord.Embed(
+    title="📊 League Statistics Command",
+    description="Advanced statistical analysis of league performance",
+    color=0xFF6347
+).add_field(
+    name="Command",
+    value="`/stats`",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Scoring consistency analysis\n• Weekly high/low performers\n• Luck vs. skill metrics\n• Team efficiency ratings",
+    inline=False
+)
+
+# League Data command details
+STANDINGS_HELP_EMBED = discord.Embed(
+    title="🏅 League Standings",
+    description="Current league standings and records",
+    color=0x32CD32
+).add_field(
+    name="Command",
+    value="`/standings`",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Team rankings by record\n• Points for and against\n• Playoff positioning\n• Season highlights",
+    inline=False
+)
 
+STATISTICS_HELP_EMBED = discord.Embed(
+    title="📈 League Statistics",
+    description="Detailed performance analytics",
+    color=0x32CD32
+).add_field(
+    name="Command",
+    value="`/stats`",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Consistency rankings\n• Weekly extremes\n• Efficiency metrics\n• Statistical insights",
+    inline=False
+)
+
+TEAM_COMPARISON_HELP_EMBED = discord.Embed(
+    title="⚖️ Team Comparison",
+    description="Head-to-head team analysis",
+    color=0x32CD32
+).add_field(
+    name="Command",
+    value="`/compare [team1] [team2]`",
+    inline=False
+).add_field(
+    name="What it shows",
+    value="• Season performance comparison\n• Head-to-head records\n• Strength analysis\n• Projection differences",
+    inline=False
+)
+
+@client.tree.command(name="menu", description="Interactive command menu for easy navigation.")
+async def menu(interaction: discord.Interaction):
+    """Main interactive menu for bot commands"""
     view = MainMenuView()
-    await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+    await interaction.response.send_message(embed=MAIN_MENU_EMBED, view=view, ephemeral=True)
 
 # Interactive Menu Views
 class MainMenuView(View):
@@ -2270,92 +2578,23 @@ class MainMenuView(View):
 
     @discord.ui.button(label="Team Analytics", emoji="📊", style=discord.ButtonStyle.primary, row=0)
     async def team_analytics(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="📊 Team Analytics Commands",
-            description="Choose a team analysis command",
-            color=0x1E90FF
-        )
-
-        embed.add_field(
-            name="Available Commands",
-            value="• `/team [name]` - View team roster & player stats\n"
-                  "• `/compare [team1] [team2]` - Compare two teams\n"
-                  "• `/matchup [team1] [team2]` - Weekly matchup analysis\n"
-                  "• `/standings` - League standings & records",
-            inline=False
-        )
-
         view = TeamAnalyticsView()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.response.edit_message(embed=TEAM_ANALYTICS_EMBED, view=view)
 
     @discord.ui.button(label="Strategy Tools", emoji="🎯", style=discord.ButtonStyle.secondary, row=0)
     async def strategy_tools(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="🎯 Strategy Tools",
-            description="Choose a strategy command",
-            color=0xFF6347
-        )
-
-        embed.add_field(
-            name="Available Commands",
-            value="• `/waiver [position] [min_owned] [max_owned]` - Waiver wire analysis\n"
-                  "• `/trade [team1] [team2] [players1] [players2]` - Trade analyzer\n"
-                  "• `/sleeper [position] [min_proj] [max_owned]` - Find sleeper picks\n"
-                  "• `/stats` - Advanced league statistics",
-            inline=False
-        )
-
         view = StrategyToolsView()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.response.edit_message(embed=STRATEGY_TOOLS_EMBED, view=view)
 
     @discord.ui.button(label="League Data", emoji="📈", style=discord.ButtonStyle.success, row=0)
     async def league_data(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="📈 League Data Commands",
-            description="Choose a league analysis command",
-            color=0x32CD32
-        )
-
-        embed.add_field(
-            name="Available Commands",
-            value="• `/standings` - Current league standings\n"
-                  "• `/stats` - Detailed league statistics\n"
-                  "• `/compare [team1] [team2]` - Head-to-head analysis",
-            inline=False
-        )
-
         view = LeagueDataView()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.response.edit_message(embed=LEAGUE_DATA_EMBED, view=view)
 
     @discord.ui.button(label="Back to Main", emoji="🏠", style=discord.ButtonStyle.gray, row=1)
     async def back_to_main(self, interaction: discord.Interaction, button: discord.ui.Button):
-        # Recreate main menu
-        embed = discord.Embed(
-            title="🏈 Fantasy Football Command Center",
-            description="Select a category to explore available commands",
-            color=0x32CD32
-        )
-
-        embed.add_field(
-            name="📊 Team Analytics",
-            value="• Team rosters & stats\n• Compare teams\n• Weekly matchups\n• League standings",
-            inline=True
-        )
-
-        embed.add_field(
-            name="🎯 Strategy Tools",
-            value="• Waiver wire analysis\n• Trade analyzer\n• Sleeper picks\n• Player stats",
-            inline=True
-        )
-
-        embed.add_field(
-            name="📈 League Data",
-            value="• Season statistics\n• Performance metrics\n• Head-to-head records",
-            inline=True
-        )
-
         view = MainMenuView()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.response.edit_message(embed=MAIN_MENU_EMBED, view=view)
 
 class TeamAnalyticsView(View):
     def __init__(self):
@@ -2363,249 +2602,49 @@ class TeamAnalyticsView(View):
 
     @discord.ui.button(label="Team Roster", emoji="👥", style=discord.ButtonStyle.primary)
     async def team_roster(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="👥 Team Roster Command",
-            description="View detailed team roster with player stats",
-            color=0x1E90FF
-        )
-        embed.add_field(
-            name="Command",
-            value="`/team [team_name]`",
-            inline=False
-        )
-        embed.add_field(
-            name="Example",
-            value="`/team Swift Nation`",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Starting lineup with projected points\n• Bench players\n• Player positions and injury status\n• Interactive buttons for filtering",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("team"))
+        await interaction.response.edit_message(embed=TEAM_ROSTER_HELP_EMBED, view=BackToMenuView("team"))
 
     @discord.ui.button(label="Compare Teams", emoji="⚖️", style=discord.ButtonStyle.primary)
     async def compare_teams(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="⚖️ Compare Teams Command",
-            description="Comprehensive team comparison analysis",
-            color=0x1E90FF
-        )
-        embed.add_field(
-            name="Command",
-            value="`/compare [team1] [team2]`",
-            inline=False
-        )
-        embed.add_field(
-            name="Example",
-            value="`/compare \"Swift Nation\" \"Team SoloMid\"`",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Season records and standings\n• Total points comparison\n• Head-to-head history\n• Weekly projections",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("team"))
+        await interaction.response.edit_message(embed=COMPARE_TEAMS_HELP_EMBED, view=BackToMenuView("team"))
 
     @discord.ui.button(label="Weekly Matchup", emoji="🏆", style=discord.ButtonStyle.primary)
     async def weekly_matchup(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="🏆 Weekly Matchup Command",
-            description="Detailed current week matchup analysis",
-            color=0x1E90FF
-        )
-        embed.add_field(
-            name="Command",
-            value="`/matchup [team1] [team2]` (team2 optional)",
-            inline=False
-        )
-        embed.add_field(
-            name="Example",
-            value="`/matchup \"Swift Nation\"` (auto-finds opponent)",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Position-by-position breakdown\n• Projected winner\n• Key players for each team\n• Matchup competitiveness",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("team"))
+        await interaction.response.edit_message(embed=WEEKLY_MATCHUP_HELP_EMBED, view=BackToMenuView("team"))
 
     @discord.ui.button(label="League Standings", emoji="🏅", style=discord.ButtonStyle.primary)
     async def league_standings(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="🏅 League Standings Command",
-            description="Current league standings and team records",
-            color=0x1E90FF
-        )
-        embed.add_field(
-            name="Command",
-            value="`/standings`",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Team rankings and records\n• Points for/against\n• Highest/lowest scoring teams\n• Best weekly performances",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("team"))
+        await interaction.response.edit_message(embed=LEAGUE_STANDINGS_HELP_EMBED, view=BackToMenuView("team"))
 
     @discord.ui.button(label="Back", emoji="⬅️", style=discord.ButtonStyle.gray, row=1)
     async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
-        # Recreate main menu directly
-        embed = discord.Embed(
-            title="🏈 Fantasy Football Command Center",
-            description="Select a category to explore available commands",
-            color=0x32CD32
-        )
+        view = MainMenuView()
+        await interaction.response.edit_message(embed=MAIN_MENU_EMBED, view=view)
 
-        embed.add_field(
-            name="📊 Team Analytics",
-            value="View individual team performance and roster analysis",
-            inline=True
-        )
-
-        embed.add_field(
-            name="🎯 Strategy Tools",
-            value="Waiver wire, trades, and strategic insights",
-            inline=True
-        )
-
-        embed.add_field(
-            name="📈 League Data",
-            value="Standings, statistics, and league-wide analysis",
-            inline=True
-        )
-
-        view = MainMenuView()
-        await interaction.response.edit_message(embed=embed, view=view)
-
-class StrategyToolsView(View):
-    def __init__(self):
-        super().__init__(timeout=300)
+class StrategyToolsView(View):
+    def __init__(self):
+        super().__init__(timeout=300)
 
     @discord.ui.button(label="Waiver Wire", emoji="🎯", style=discord.ButtonStyle.secondary)
     async def waiver_wire(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="🎯 Waiver Wire Command",
-            description="Analyze available free agents for pickup opportunities",
-            color=0xFF6347
-        )
-        embed.add_field(
-            name="Command",
-            value="`/waiver [position] [min_owned] [max_owned]`",
-            inline=False
-        )
-        embed.add_field(
-            name="Example",
-            value="`/waiver RB 0 25` (RBs owned by 0-25% of leagues)",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Top available players by projection\n• Hidden gems (low ownership, high points)\n• Position depth analysis\n• Ownership insights",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("strategy"))
+        await interaction.response.edit_message(embed=WAIVER_WIRE_HELP_EMBED, view=BackToMenuView("strategy"))
 
     @discord.ui.button(label="Trade Analyzer", emoji="🤝", style=discord.ButtonStyle.secondary)
     async def trade_analyzer(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="🤝 Trade Analyzer Command",
-            description="Comprehensive analysis of potential trades",
-            color=0xFF6347
-        )
-        embed.add_field(
-            name="Command",
-            value="`/trade [team1] [team2] [team1_players] [team2_players]`",
-            inline=False
-        )
-        embed.add_field(
-            name="Example",
-            value="`/trade \"Swift Nation\" \"Team SoloMid\" \"Lamar Jackson\" \"Josh Allen\"`",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Projected points comparison\n• Season average analysis\n• Trade fairness assessment\n• Position analysis\n• Injury risk evaluation",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("strategy"))
+        await interaction.response.edit_message(embed=TRADE_ANALYZER_HELP_EMBED, view=BackToMenuView("strategy"))
 
     @discord.ui.button(label="Sleeper Picks", emoji="😴", style=discord.ButtonStyle.secondary)
     async def sleeper_picks(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="😴 Sleeper Picks Command",
-            description="Find undervalued players with upside potential",
-            color=0xFF6347
-        )
-        embed.add_field(
-            name="Command",
-            value="`/sleeper [position] [min_projection] [max_owned]`",
-            inline=False
-        )
-        embed.add_field(
-            name="Example",
-            value="`/sleeper WR 8 15` (WRs with 8+ pts, <15% owned)",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• High-upside, low-owned players\n• Breakout candidate analysis\n• Value vs. ownership comparison\n• Position-specific sleepers",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("strategy"))
+        await interaction.response.edit_message(embed=SLEEPER_PICKS_HELP_EMBED, view=BackToMenuView("strategy"))
 
     @discord.ui.button(label="League Stats", emoji="📊", style=discord.ButtonStyle.secondary)
     async def league_stats(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="📊 League Statistics Command",
-            description="Advanced statistical analysis of league performance",
-            color=0xFF6347
-        )
-        embed.add_field(
-            name="Command",
-            value="`/stats`",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Scoring consistency analysis\n• Weekly high/low performers\n• Luck vs. skill metrics\n• Team efficiency ratings",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("strategy"))
+        await interaction.response.edit_message(embed=LEAGUE_STATS_HELP_EMBED, view=BackToMenuView("strategy"))
 
     @discord.ui.button(label="Back", emoji="⬅️", style=discord.ButtonStyle.gray, row=1)
     async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
-        # Recreate main menu directly
-        embed = discord.Embed(
-            title="🏈 Fantasy Football Command Center",
-            description="Select a category to explore available commands",
-            color=0x32CD32
-        )
-
-        embed.add_field(
-            name="📊 Team Analytics",
-            value="View individual team performance and roster analysis",
-            inline=True
-        )
-
-        embed.add_field(
-            name="🎯 Strategy Tools",
-            value="Waiver wire, trades, and strategic insights",
-            inline=True
-        )
-
-        embed.add_field(
-            name="📈 League Data",
-            value="Standings, statistics, and league-wide analysis",
-            inline=True
-        )
-
         view = MainMenuView()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.response.edit_message(embed=MAIN_MENU_EMBED, view=view)
 
 class LeagueDataView(View):
     def __init__(self):
@@ -2613,181 +2652,42 @@ class LeagueDataView(View):
 
     @discord.ui.button(label="Standings", emoji="🏅", style=discord.ButtonStyle.success)
     async def standings(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="🏅 League Standings",
-            description="Current league standings and records",
-            color=0x32CD32
-        )
-        embed.add_field(
-            name="Command",
-            value="`/standings`",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Team rankings by record\n• Points for and against\n• Playoff positioning\n• Season highlights",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("league"))
+        await interaction.response.edit_message(embed=STANDINGS_HELP_EMBED, view=BackToMenuView("league"))
 
     @discord.ui.button(label="Statistics", emoji="📈", style=discord.ButtonStyle.success)
     async def statistics(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="📈 League Statistics",
-            description="Detailed performance analytics",
-            color=0x32CD32
-        )
-        embed.add_field(
-            name="Command",
-            value="`/stats`",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Consistency rankings\n• Weekly extremes\n• Efficiency metrics\n• Statistical insights",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("league"))
+        await interaction.response.edit_message(embed=STATISTICS_HELP_EMBED, view=BackToMenuView("league"))
 
     @discord.ui.button(label="Team Comparison", emoji="⚖️", style=discord.ButtonStyle.success)
     async def team_comparison(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="⚖️ Team Comparison",
-            description="Head-to-head team analysis",
-            color=0x32CD32
-        )
-        embed.add_field(
-            name="Command",
-            value="`/compare [team1] [team2]`",
-            inline=False
-        )
-        embed.add_field(
-            name="What it shows",
-            value="• Season performance comparison\n• Head-to-head records\n• Strength analysis\n• Projection differences",
-            inline=False
-        )
-        await interaction.response.edit_message(embed=embed, view=BackToMenuView("league"))
+        await interaction.response.edit_message(embed=TEAM_COMPARISON_HELP_EMBED, view=BackToMenuView("league"))
 
     @discord.ui.button(label="Back", emoji="⬅️", style=discord.ButtonStyle.gray, row=1)
     async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
-        # Recreate main menu directly instead of calling method on new instance
-        embed = discord.Embed(
-            title="🏈 Fantasy Football Command Center",
-            description="Select a category to explore available commands",
-            color=0x32CD32
-        )
-
-        embed.add_field(
-            name="📊 Team Analytics",
-            value="View individual team performance and roster analysis",
-            inline=True
-        )
-
-        embed.add_field(
-            name="🎯 Strategy Tools",
-            value="Waiver wire, trades, and strategic insights",
-            inline=True
-        )
-
-        embed.add_field(
-            name="📈 League Data",
-            value="Standings, statistics, and league-wide analysis",
-            inline=True
-        )
-
         view = MainMenuView()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.response.edit_message(embed=MAIN_MENU_EMBED, view=view)
 
 class BackToMenuView(View):
+    # Category embed and view to return to for each menu type
+    CATEGORY_MENUS = {
+        "team": (TEAM_ANALYTICS_EMBED, TeamAnalyticsView),
+        "strategy": (STRATEGY_TOOLS_EMBED, StrategyToolsView),
+        "league": (LEAGUE_DATA_EMBED, LeagueDataView),
+    }
+
     def __init__(self, menu_type):
         super().__init__(timeout=300)
         self.menu_type = menu_type
 
     @discord.ui.button(label="Back to Category", emoji="⬅️", style=discord.ButtonStyle.gray)
     async def back_to_category(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.menu_type == "team":
-            embed = discord.Embed(
-                title="📊 Team Analytics Commands",
-                description="Choose a team analysis command",
-                color=0x1E90FF
-            )
-
-            embed.add_field(
-                name="Available Commands",
-                value="• `/team [name]` - View team roster & player stats\n"
-                      "• `/compare [team1] [team2]` - Compare two teams\n"
-                      "• `/matchup [team1] [team2]` - Weekly matchup analysis\n"
-                      "• `/standings` - League standings & records",
-                inline=False
-            )
-
-            view = TeamAnalyticsView()
-            await interaction.response.edit_message(embed=embed, view=view)
-        elif self.menu_type == "strategy":
-            embed = discord.Embed(
-                title="🎯 Strategy Tools",
-                description="Choose a strategy command",
-                color=0xFF6347
-            )
-
-            embed.add_field(
-                name="Available Commands",
-                value="• `/waiver [position] [min_owned] [max_owned]` - Waiver wire analysis\n"
-                      "• `/trade [team1] [team2] [players1] [players2]` - Trade analyzer\n"
-                      "• `/sleeper [position] [min_proj] [max_owned]` - Find sleeper picks\n"
-                      "• `/stats` - Advanced league statistics",
-                inline=False
-            )
-
-            view = StrategyToolsView()
-            await interaction.response.edit_message(embed=embed, view=view)
-        elif self.menu_type == "league":
-            embed = discord.Embed(
-                title="📈 League Data Commands",
-                description="Choose a league analysis command",
-                color=0x32CD32
-            )
-
-            embed.add_field(
-                name="Available Commands",
-                value="• `/standings` - Current league standings\n"
-                      "• `/stats` - Detailed league statistics\n"
-                      "• `/compare [team1] [team2]` - Head-to-head analysis",
-                inline=False
-            )
-
-            view = LeagueDataView()
-            await interaction.response.edit_message(embed=embed, view=view)
+        embed, view_class = self.CATEGORY_MENUS[self.menu_type]
+        await interaction.response.edit_message(embed=embed, view=view_class())
 
     @discord.ui.button(label="Main Menu", emoji="🏠", style=discord.ButtonStyle.primary)
     async def back_to_main(self, interaction: discord.Interaction, button: discord.ui.Button):
-        # Recreate main menu
-        embed = discord.Embed(
-            title="🏈 Fantasy Football Command Center",
-            description="Select a category to explore available commands",
-            color=0x32CD32
-        )
-
-        embed.add_field(
-            name="📊 Team Analytics",
-            value="• Team rosters & stats\n• Compare teams\n• Weekly matchups\n• League standings",
-            inline=True
-        )
-
-        embed.add_field(
-            name="🎯 Strategy Tools",
-            value="• Waiver wire analysis\n• Trade analyzer\n• Sleeper picks\n• Player stats",
-            inline=True
-        )
-
-        embed.add_field(
-            name="📈 League Data",
-            value="• Season statistics\n• Performance metrics\n• Head-to-head records",
-            inline=True
-        )
-
         view = MainMenuView()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.response.edit_message(embed=MAIN_MENU_EMBED, view=view)
 
 @client.tree.command(name="card", description="Generate a visual team card with key stats and graphics.")
 @app_commands.describe(team_name="Team name to generate card for")
@@ -2797,58 +2697,28 @@ async def card(interaction: discord.Interaction, team_name: str):
         return
 
     try:
-        # Helper function to ensure field values don't exceed 1024 characters
-        def safe_field_value(text, max_length=1024):
-            if len(text) <= max_length:
-                return text
-            return text[:max_length-3] + "..."
-
         league = get_league(user_id=interaction.user.id)
         if not league:
             await safe_interaction_response(interaction, "❌ No league found. Use `/register_league` to add your ESPN Fantasy League first, or contact an admin if you want to use the default league.", ephemeral=True)
             return
 
         # Find the team
-        team = None
-        for t in league.teams:
-            if team_name.lower() in t.team_name.lower():
-                team = t
-                break
+        team = find_team(league, team_name)
 
         if not team:
-            await safe_interaction_response(interaction, f"Team '{team_name}' not found. Available teams: {', '.join(t.team_name for t in league.teams)}", ephemeral=True)
+            await safe_interaction_response(interaction, f"Team '{team_name}' not found. Available teams: {get_team_names_text(league)}", ephemeral=True)
             return
 
         # Get current week
         current_week = getattr(league, 'current_week', 1)
 
-        # Calculate team stats
-        def calculate_team_stats(team):
-            total_points = 0
-            games_played = 0
-            weekly_scores = []
+        # Calculate team stats over completed weeks only
+        completed_weeks = max(current_week - 1, 0)
 
-            # Get weekly scores
-            for week in range(1, current_week):
-                try:
-                    week_score = team.scores[week - 1] if len(team.scores) >= week else 0
-                    if week_score > 0:
-                        weekly_scores.append(week_score)
-                        total_points += week_score
-                        games_played += 1
-                except (IndexError, AttributeError):
-                    pass
-
-            avg_points = total_points / max(games_played, 1)
-
-            # Calculate consistency (lower std dev = more consistent)
-            if len(weekly_scores) > 1:
-                mean_score = sum(weekly_scores) / len(weekly_scores)
-                variance = sum((score - mean_score) ** 2 for score in weekly_scores) / len(weekly_scores)
-                std_dev = variance ** 0.5
-                consistency = max(0, 100 - (std_dev / mean_score) * 100) if mean_score > 0 else 0
-            else:
-                consistency = 100
+        def calculate_team_stats(team):
+            # Slice the completed weeks and keep positive (played) scores
+            weekly_scores = [score for score in getattr(team, 'scores', [])[:completed_weeks] if score > 0]
+            total_points, games_played, avg_points, consistency, high_score, low_score = calculate_score_stats(weekly_scores)
 
             return {
                 'total_points': total_points,
@@ -2856,20 +2726,41 @@ async def card(interaction: discord.Interaction, team_name: str):
                 'games_played': games_played,
                 'weekly_scores': weekly_scores,
                 'consistency': consistency,
-                'high_score': max(weekly_scores) if weekly_scores else 0,
-                'low_score': min(weekly_scores) if weekly_scores else 0
+                'high_score': high_score,
+                'low_score': low_score
             }
 
-        stats = calculate_team_stats(team)
+        # Compute stats for every team in one pass, tracking the league max for the bars
+        stats_by_id = {}
+        league_max_avg = 0
+        for t in league.teams:
+            team_stats = stats_by_id[t.team_id] = calculate_team_stats(t)
+            if team_stats['avg_points'] > league_max_avg:
+                league_max_avg = team_stats['avg_points']
+        stats = stats_by_id[team.team_id]
+
+        # Resolve each player's current week points only once
+        proj_cache = {}
+        def get_proj(player):
+            key = id(player)
+            value = proj_cache.get(key)
+            if value is None:
+                value = get_current_week_points(player, league)
+                proj_cache[key] = value
+            return value
+
+        # Build each team's starters once
+        starters_by_id = {t.team_id: [p for p in t.roster if getattr(p, 'lineupSlot', None) != "BE"] for t in league.teams}
 
         # Get current roster strength
-        starters = [p for p in team.roster if getattr(p, 'lineupSlot', None) != "BE"]
-        total_projected = sum(get_current_week_points(p, league) for p in starters if get_current_week_points(p, league) != 'N/A')
+        # One pass per team over its starters; the focal team's total is reused below
+        projected_by_id = {tid: sum(v for v in map(get_proj, team_starters) if v != 'N/A') for tid, team_starters in starters_by_id.items()}
+        total_projected = projected_by_id[team.team_id]
 
         # Find team's best players
         all_players = []
         for player in team.roster:
-            proj = get_current_week_points(player, league)
+            proj = get_proj(player)
             if proj != 'N/A' and proj > 0:
                 all_players.append({
                     'name': player.name,
@@ -2878,8 +2769,7 @@ async def card(interaction: discord.Interaction, team_name: str):
                     'player': player
                 })
 
-        all_players.sort(key=lambda x: x['projected'], reverse=True)
-        top_3_players = all_players[:3]
+        top_3_players = heapq.nlargest(3, all_players, key=itemgetter('projected'))
 
         # Create rich embed with visual elements
         embed = discord.Embed(
@@ -2892,51 +2782,21 @@ async def card(interaction: discord.Interaction, team_name: str):
         losses = getattr(team, 'losses', 0)
         record = f"{wins}-{losses}"
 
-        # Calculate rank
-        sorted_teams = sorted(league.teams, key=lambda t: (getattr(t, 'wins', 0), getattr(t, 'points_for', 0)), reverse=True)
-        rank = next((i + 1 for i, t in enumerate(sorted_teams) if t.team_id == team.team_id), 0)
+        # Calculate overall and scoring rank in one pass by counting the teams ahead
+        record_key = RECORD_RANK_KEY(team)
+        rank = points_position = 1
+        for t in league.teams:
+            if RECORD_RANK_KEY(t) > record_key:
+                rank += 1
+            if stats_by_id[t.team_id]['avg_points'] > stats['avg_points']:
+                points_position += 1
 
         # Get owner name properly
-        owner_data = getattr(team, 'owner', None)
-        owner_name = "N/A"
-
-        if owner_data:
-            if isinstance(owner_data, dict):
-                # Extract display name from dictionary
-                owner_name = (owner_data.get('displayName') or
-                             f"{owner_data.get('firstName', '')} {owner_data.get('lastName', '')}".strip() or
-                             owner_data.get('id', 'N/A'))
-            elif isinstance(owner_data, str):
-                owner_name = owner_data
-            elif isinstance(owner_data, list) and owner_data:
-                # Handle list of owners - get the first one
-                first_owner = owner_data[0]
-                if isinstance(first_owner, dict):
-                    owner_name = (first_owner.get('displayName') or
-                                 f"{first_owner.get('firstName', '')} {first_owner.get('lastName', '')}".strip() or
-                                 first_owner.get('id', 'N/A'))
-                else:
-                    owner_name = str(first_owner)
-
-        # Try alternative owner attributes if still no name
-        if owner_name == "N/A" or not owner_name:
-            # Check if owner is actually stored as a string representation of the data
-            owner_str = str(getattr(team, 'owner', ''))
-            if 'displayName' in owner_str:
-                # Try to extract displayName from string representation
-                import re
-                display_match = re.search(r"'displayName': '([^']+)'", owner_str)
-                if display_match:
-                    owner_name = display_match.group(1)
-                else:
-                    # Try without quotes
-                    display_match = re.search(r"'displayName': ([^,}]+)", owner_str)
-                    if display_match:
-                        owner_name = display_match.group(1).strip("'\"")
+        owner_name = str(extract_display_name(getattr(team, 'owner', None)) or "N/A")
 
         # Clean up email addresses to show just the name part
         if owner_name and '@' in owner_name and '.' in owner_name:
-            owner_name = owner_name.split('@')[0]
+            owner_name = owner_name.partition('@')[0]
 
         # Ensure we have a clean name
         if not owner_name or owner_name == "N/A" or len(str(owner_name)) > 50:
@@ -2950,19 +2810,20 @@ async def card(interaction: discord.Interaction, team_name: str):
         )
 
         # Performance metrics with visual bars
-        def create_progress_bar(value, max_value, length=10):
-            filled = int((value / max_value) * length) if max_value > 0 else 0
-            bar = "=" * filled + "-" * (length - filled)
+        def create_progress_bar(value, max_value, length=PROGRESS_BAR_LENGTH):
+            filled = max(0, min(length, int((value / max_value) * length))) if max_value > 0 else 0
+            bar = PROGRESS_BARS[filled] if length == PROGRESS_BAR_LENGTH else "=" * filled + "-" * (length - filled)
             return f"`[{bar}]` {value:.1f}"
 
         # Find league max for scaling bars
-        league_max_avg = max(calculate_team_stats(t)['avg_points'] for t in league.teams)
-        league_max_proj = max(sum(get_current_week_points(p, league) for p in t.roster if getattr(p, 'lineupSlot', None) != "BE" and get_current_week_points(p, league) != 'N/A') for t in league.teams)
+        league_max_proj = max(projected_by_id.values())
 
-        performance_text = f"**Average Points:** {create_progress_bar(stats['avg_points'], league_max_avg)}\n"
-        performance_text += f"**Projected (Week {current_week}):** {create_progress_bar(total_projected, league_max_proj)}\n"
-        performance_text += f"**Consistency:** {create_progress_bar(stats['consistency'], 100)} %\n"
-        performance_text += f"**High Score:** {stats['high_score']:.1f} | **Low Score:** {stats['low_score']:.1f}"
+        performance_text = "\n".join([
+            f"**Average Points:** {create_progress_bar(stats['avg_points'], league_max_avg)}",
+            f"**Projected (Week {current_week}):** {create_progress_bar(total_projected, league_max_proj)}",
+            f"**Consistency:** {create_progress_bar(stats['consistency'], 100)} %",
+            f"**High Score:** {stats['high_score']:.1f} | **Low Score:** {stats['low_score']:.1f}"
+        ])
 
         embed.add_field(
             name="📈 Performance Metrics",
@@ -2972,30 +2833,30 @@ async def card(interaction: discord.Interaction, team_name: str):
 
         # Star players section
         if top_3_players:
-            stars_text = ""
-            star_emojis = ["⭐", "🌟", "✨"]
-            for i, player in enumerate(top_3_players):
-                emoji = star_emojis[i] if i < len(star_emojis) else "🔸"
-                stars_text += f"{emoji} **{player['name']}** ({player['position']}) - {player['projected']:.1f} pts\n"
+            star_emojis = ("⭐", "🌟", "✨")
+            stars_text = "\n".join(
+                f"{star_emojis[i] if i < len(star_emojis) else '🔸'} **{player['name']}** ({player['position']}) - {player['projected']:.1f} pts"
+                for i, player in enumerate(top_3_players)
+            )
 
             embed.add_field(
                 name="🌟 Star Players",
-                value=safe_field_value(stars_text.strip()),
+                value=safe_field_value(stars_text),
                 inline=True
             )
 
         # Recent form (last 3 games)
         recent_scores = stats['weekly_scores'][-3:] if len(stats['weekly_scores']) >= 3 else stats['weekly_scores']
         if recent_scores:
-            form_text = ""
-            for i, score in enumerate(recent_scores):
-                week_num = len(stats['weekly_scores']) - len(recent_scores) + i + 1
-                form_text += f"Week {week_num}: {score:.1f}\n"
+            first_week = len(stats['weekly_scores']) - len(recent_scores) + 1
+            form_parts = [f"Week {first_week + i}: {score:.1f}" for i, score in enumerate(recent_scores)]
 
             # Calculate trend
             if len(recent_scores) >= 2:
                 trend = "📈" if recent_scores[-1] > recent_scores[-2] else "📉" if recent_scores[-1] < recent_scores[-2] else "➡️"
-                form_text += f"\nTrend: {trend}"
+                form_parts.extend(["", f"Trend: {trend}"])
+
+            form_text = "\n".join(form_parts)
 
             embed.add_field(
                 name="📊 Recent Form",
@@ -3005,12 +2866,11 @@ async def card(interaction: discord.Interaction, team_name: str):
 
         # League context
         total_teams = len(league.teams)
-        points_rank = sorted(league.teams, key=lambda t: calculate_team_stats(t)['avg_points'], reverse=True)
-        points_position = next((i + 1 for i, t in enumerate(points_rank) if t.team_id == team.team_id), 0)
-
-        context_text = f"**League Position:** #{rank} of {total_teams}\n"
-        context_text += f"**Scoring Rank:** #{points_position} of {total_teams}\n"
-        context_text += f"**Games Played:** {stats['games_played']}"
+        context_text = "\n".join([
+            f"**League Position:** #{rank} of {total_teams}",
+            f"**Scoring Rank:** #{points_position} of {total_teams}",
+            f"**Games Played:** {stats['games_played']}"
+        ])
 
         embed.add_field(
             name="🏆 League Context",
@@ -3024,19 +2884,19 @@ async def card(interaction: discord.Interaction, team_name: str):
         consistency_score = (stats['consistency'] / 100) * 20  # 20% weight
         power_rating = record_score + points_score + consistency_score
 
-        rating_text = f"**Power Rating:** {power_rating:.1f}/100\n"
-
         # Rating description
         if power_rating >= 80:
-            rating_text += "🔥 **Elite** - Championship contender"
+            rating_description = "🔥 **Elite** - Championship contender"
         elif power_rating >= 65:
-            rating_text += "💪 **Strong** - Playoff bound"
+            rating_description = "💪 **Strong** - Playoff bound"
         elif power_rating >= 50:
-            rating_text += "⚖️ **Average** - In the mix"
+            rating_description = "⚖️ **Average** - In the mix"
         elif power_rating >= 35:
-            rating_text += "⚠️ **Struggling** - Needs improvement"
+            rating_description = "⚠️ **Struggling** - Needs improvement"
         else:
-            rating_text += "🆘 **Rebuilding** - Long season ahead"
+            rating_description = "🆘 **Rebuilding** - Long season ahead"
+
+        rating_text = f"**Power Rating:** {power_rating:.1f}/100\n{rating_description}"
 
         embed.add_field(
             name="⚡ Power Rating",
@@ -3054,6 +2914,84 @@ async def card(interaction: discord.Interaction, team_name: str):
         print(f"Card error: {e}")
         await safe_interaction_response(interaction, error_msg, ephemeral=True)
 
+@lru_cache(maxsize=256)
+def format_team_name(name, max_length=14):
+    """Shorten a team name for the scoreboard (team names don't change between refreshes)"""
+    if len(name) <= max_length:
+        return name
+
+    # Split off the first word only - the rest of the name is never needed
+    words = name.split(maxsplit=1)
+    if len(words) < 2:
+        return name[:max_length-1] + "."
+
+    # Two or more words: first word + first letter of second word only
+    first_word, rest = words
+    result = f"{first_word} {rest[0]}."
+    if len(result) <= max_length:
+        return result
+    return first_word[:max_length-3] + " " + rest[0] + "."
+
+def format_scoreboard_line(name1, score1, score2, name2):
+    """Format one scoreboard matchup line with the winner triangle pointing at the leader"""
+    # (score1 > score2) - (score2 > score1) is 1, -1 or 0 - index -1 picks the team 2 template
+    line_format = SCOREBOARD_LINE_FORMATS[(score1 > score2) - (score2 > score1)]
+    return line_format.format(name1, score1, score2, name2)
+
+# Header repeated at the top of each continuation table
+SCOREBOARD_CONTINUATION_HEADER = (
+    "Team 1            | Score   | Team 2            | Score",
+    "------------------|---------|-------------------|-------"
+)
+
+def split_scoreboard_table(lines, char_limit=SCOREBOARD_CHAR_LIMIT):
+    """Split scoreboard lines into code blocks that each fit within char_limit"""
+    code_block_overhead = len("```\n\n```") - 1  # Less the newline counted with each line
+    tables = []
+    current_lines = []
+    current_length = code_block_overhead
+
+    for line in lines:
+        # Track the running block length instead of re-joining the lines for every check
+        if current_lines and current_length + len(line) + 1 > char_limit:
+            tables.append(f"```\n{chr(10).join(current_lines)}\n```")
+
+            # Start new block, with a header for continuation
+            current_lines = [] if line.startswith("Team 1") else list(SCOREBOARD_CONTINUATION_HEADER)
+            current_length = code_block_overhead + sum(len(header) + 1 for header in current_lines)
+
+        current_lines.append(line)
+        current_length += len(line) + 1
+
+    if current_lines:
+        tables.append(f"```\n{chr(10).join(current_lines)}\n```")
+    return tables
+
+def build_scoreboard_table_embeds(table_lines, used_chars):
+    """Build the matchup table embeds that fit in one message next to used_chars of other embed text"""
+    budget = DISCORD_MESSAGE_EMBED_TEXT_LIMIT - SCOREBOARD_SUMMARY_RESERVE - used_chars
+    table_embeds = []
+    shown_matchups = 0
+
+    for table_content in split_scoreboard_table(table_lines):
+        title = f"📊 Matchups{f' (Part {len(table_embeds) + 1})' if table_embeds else ''}"
+        embed_chars = len(title) + len("Current Scores") + len(table_content)
+        # Stop at Discord's embed count or combined text limit - the first table always goes out
+        if table_embeds and (len(table_embeds) >= SCOREBOARD_MAX_TABLE_EMBEDS or embed_chars > budget):
+            break
+
+        table_embed = discord.Embed(title=title, color=0x32CD32)
+        table_embed.add_field(name="Current Scores", value=table_content, inline=False)
+        table_embeds.append(table_embed)
+        budget -= embed_chars
+        # Count matchup rows only - skip the code fences and any continuation header
+        shown_matchups += sum(1 for line in table_content.split("\n")[1:-1] if line not in SCOREBOARD_CONTINUATION_HEADER)
+
+    hidden_matchups = len(table_lines) - shown_matchups
+    if hidden_matchups > 0:
+        table_embeds[-1].set_footer(text=f"+{hidden_matchups} more matchups not shown")
+    return table_embeds
+
 @client.tree.command(name="scoreboard", description="Live updating scoreboard for current week matchups.")
 @app_commands.describe(auto_refresh="Enable auto-refresh every 30 seconds (default: True)")
 async def scoreboard(interaction: discord.Interaction, auto_refresh: bool = True):
@@ -3080,10 +3018,37 @@ async def scoreboard(interaction: discord.Interaction, auto_refresh: bool = True
             # Create team pairings based on current week schedule
             teams_in_matchups = set()
 
+            # Walk each roster once: starters for scoring plus how many of them are yet to play
+            starters_by_id = {}
+            yet_to_play_by_id = {}
+            for t in league.teams:
+                starters = starters_by_id[t.team_id] = [p for p in t.roster if getattr(p, 'lineupSlot', None) != "BE"]
+                # Injured players and players with ACTUAL points don't count as "yet to play"
+                yet_to_play_by_id[t.team_id] = sum(
+                    1 for p in starters
+                    if getattr(p, 'injuryStatus', '') not in OUT_INJURY_STATUSES and not has_actual_points(p, current_week)
+                )
+
+            # Fetch box scores once and index by team: team_id -> (team_score, opponent, opponent_score)
+            box_scores_by_team = {}
+            try:
+                for box_score in league.box_scores(current_week):
+                    home_team = getattr(box_score, 'home_team', None)
+                    away_team = getattr(box_score, 'away_team', None)
+                    if hasattr(home_team, 'team_id') and hasattr(away_team, 'team_id'):
+                        home_score = getattr(box_score.home_score, 'total_points', 0) or getattr(box_score, 'home_score', 0)
+                        away_score = getattr(box_score.away_score, 'total_points', 0) or getattr(box_score, 'away_score', 0)
+                        box_scores_by_team[home_team.team_id] = (home_score, away_team, away_score)
+                        box_scores_by_team[away_team.team_id] = (away_score, home_team, home_score)
+            except Exception as e:
+                print(f"Box score method failed: {e}")
+
             for team in league.teams:
                 if team.team_id in teams_in_matchups:
                     continue
 
+                box_score_entry = box_scores_by_team.get(team.team_id)
+
                 # Find this team's opponent for current week
                 opponent = None
                 if hasattr(team, 'schedule') and len(team.schedule) >= current_week:
@@ -3097,41 +3062,16 @@ async def scoreboard(interaction: discord.Interaction, auto_refresh: bool = True
                         pass
 
                 # Alternative method: check box scores
-                if not opponent:
-                    try:
-                        box_score = league.box_scores(current_week)
-                        for matchup in box_score:
-                            if hasattr(matchup, 'home_team') and hasattr(matchup, 'away_team'):
-                                if matchup.home_team.team_id == team.team_id:
-                                    opponent = matchup.away_team
-                                    break
-                                elif matchup.away_team.team_id == team.team_id:
-                                    opponent = matchup.home_team
-                                    break
-                    except Exception:
-                        pass
+                if not opponent and box_score_entry:
+                    opponent = box_score_entry[1]
 
                 if opponent and opponent.team_id not in teams_in_matchups:
-                    # Try multiple methods to get current scores
-                    team_score = 0
-                    opponent_score = 0
-
-                    # Method 1: Try box scores API
-                    try:
-                        box_scores = league.box_scores(current_week)
-                        for box_score in box_scores:
-                            if hasattr(box_score, 'home_team') and hasattr(box_score, 'away_team'):
-                                if box_score.home_team.team_id == team.team_id:
-                                    team_score = getattr(box_score.home_score, 'total_points', 0) or getattr(box_score, 'home_score', 0)
-                                    opponent_score = getattr(box_score.away_score, 'total_points', 0) or getattr(box_score, 'away_score', 0)
-                                    break
-                                elif box_score.away_team.team_id == team.team_id:
-                                    team_score = getattr(box_score.away_score, 'total_points', 0) or getattr(box_score, 'away_score', 0)
-                                    opponent_score = getattr(box_score.home_score, 'total_points', 0) or getattr(box_score, 'home_score', 0)
-                                    break
-                    except Exception as e:
-                        print(f"Box score method failed: {e}")
-                        pass
+                    # Method 1: Use the indexed box scores
+                    if box_score_entry:
+                        team_score, _, opponent_score = box_score_entry
+                    else:
+                        team_score = 0
+                        opponent_score = 0
 
                     # Method 2: Try team.scores if box scores didn't work
                     if team_score == 0 and opponent_score == 0:
@@ -3145,35 +3085,8 @@ async def scoreboard(interaction: discord.Interaction, auto_refresh: bool = True
 
                     # Method 3: Calculate actual points only (no projected scores)
                     if team_score == 0 and opponent_score == 0:
-                        def get_actual_points_only(player, league_ref):
-                            """Get only actual points, not projected"""
-                            current_week = getattr(league_ref, 'current_week', 1)
-                            if hasattr(player, 'stats') and player.stats:
-                                try:
-                                    week_stats = player.stats.get(current_week, {})
-                                    actual_points = week_stats.get('points', None)
-                                    if actual_points is not None and actual_points > 0:
-                                        return actual_points
-
-                                    # Check applied stats for actual game performance
-                                    applied_stats = week_stats.get('appliedStats', {})
-                                    if applied_stats and len(applied_stats) > 0:
-                                        # Calculate points from actual stats if available
-                                        total_points = 0
-                                        for stat_id, value in applied_stats.items():
-                                            if isinstance(value, (int, float)) and value > 0:
-                                                total_points += value
-                                        if total_points > 0:
-                                            return total_points
-                                except:
-                                    pass
-                            return 0
-
-                        starters = [p for p in team.roster if getattr(p, 'lineupSlot', None) != "BE"]
-                        team_score = sum(get_actual_points_only(p, league) for p in starters)
-
-                        opp_starters = [p for p in opponent.roster if getattr(p, 'lineupSlot', None) != "BE"]
-                        opponent_score = sum(get_actual_points_only(p, league) for p in opp_starters)
+                        team_score = sum(get_actual_points_only(p, current_week) for p in starters_by_id[team.team_id])
+                        opponent_score = sum(get_actual_points_only(p, current_week) for p in starters_by_id[opponent.team_id])
 
                     matchups.append({
                         'team1': team,
@@ -3201,98 +3114,14 @@ async def scoreboard(interaction: discord.Interaction, auto_refresh: bool = True
                 )
 
                 # Add refresh timestamp
-                import datetime
-                now = datetime.datetime.now()
-                header_embed.set_footer(text=f"Last updated: {now.strftime('%I:%M:%S %p')}")
+                header_embed.set_footer(text=time.strftime(SCOREBOARD_FOOTER_FORMAT))
                 embeds.append(header_embed)
 
-                # Get remaining players info function
-                def get_remaining_players(team, league_ref):
-                    starters = [p for p in team.roster if getattr(p, 'lineupSlot', None) != "BE"]
-                    total_starters = len(starters)
-                    yet_to_play = 0
-
-                    def has_actual_points(player, league):
-                        """Check if player has actual points (not just projected)"""
-                        current_week = getattr(league, 'current_week', 1)
-
-                        # Check player stats for actual points
-                        if hasattr(player, 'stats') and player.stats:
-                            try:
-                                week_stats = player.stats.get(current_week, {})
-                                # Look for actual points - ESPN uses different keys
-                                actual_points = week_stats.get('points', None)
-                                if actual_points is not None and actual_points > 0:
-                                    return True
-
-                                # Check applied stats (actual game stats)
-                                applied_stats = week_stats.get('appliedStats', {})
-                                if applied_stats and len(applied_stats) > 0:
-                                    # If there are applied stats, player has played
-                                    return True
-
-                            except Exception:
-                                pass
-
-                        # Check if player has game-specific attributes indicating they played
-                        if hasattr(player, 'game_played'):
-                            game_played = getattr(player, 'game_played', 0)
-                            if game_played > 0:
-                                return True
-
-                        return False
-
-                    try:
-                        for player in starters:
-                            player_yet_to_play = True
-
-                            try:
-                                # Check injury status first - injured players don't count as "yet to play"
-                                injury_status = getattr(player, 'injuryStatus', '')
-                                if injury_status in ['OUT', 'IR', 'SUSPENDED']:
-                                    player_yet_to_play = False
-
-                                # Check if player has ACTUAL points (not projected)
-                                elif has_actual_points(player, league_ref):
-                                    player_yet_to_play = False
-
-                                if player_yet_to_play:
-                                    yet_to_play += 1
-
-                            except Exception:
-                                # If we can't determine status, assume yet to play
-                                yet_to_play += 1
-
-                    except Exception:
-                        # If anything fails, fall back to showing all players
-                        yet_to_play = total_starters
-
-                    return f"{yet_to_play}/{total_starters}"
-
-                # Helper function to format team names
-                def format_team_name(name, max_length=14):
-                    if len(name) <= max_length:
-                        return name
-
-                    words = name.split()
-                    if len(words) == 1:
-                        return name[:max_length-1] + "."
-
-                    # Two or more words: first word + first letter of second word only
-                    if len(words) >= 2:
-                        result = f"{words[0]} {words[1][0]}."
-                        if len(result) <= max_length:
-                            return result
-                        else:
-                            return words[0][:max_length-3] + " " + words[1][0] + "."
-
-                    return words[0][:max_length-1] + "."
-
-                # Build simple vs-style lines
-                all_table_lines = []
+                # Get remaining players info from the roster snapshot
+                def get_remaining_players(team):
+                    return f"{yet_to_play_by_id[team.team_id]}/{len(starters_by_id[team.team_id])}"
 
-                # First pass: calculate the longest team name to determine optimal spacing
-                max_name_length = 0
+                # Build simple vs-style lines - first pass: format team names with their remaining player counts
                 formatted_matchups = []
 
                 for matchup in matchups:
@@ -3302,21 +3131,17 @@ async def scoreboard(interaction: discord.Interaction, auto_refresh: bool = True
                     score2 = matchup['score2']
 
                     # Get remaining players for each team first
-                    team1_remaining = get_remaining_players(team1, league)
-                    team2_remaining = get_remaining_players(team2, league)
+                    team1_remaining = get_remaining_players(team1)
+                    team2_remaining = get_remaining_players(team2)
 
                     # Format team names with balanced length for better identification while maintaining alignment
                     base_name1 = format_team_name(team1.team_name, 9)
                     base_name2 = format_team_name(team2.team_name, 9)
 
-                    # Ensure consistent formatting by padding remaining player counts
-                    # This handles both single digit (8/9) and double digit (11/11) counts
-                    name1 = f"{base_name1} ({team1_remaining})"
-                    name2 = f"{base_name2} ({team2_remaining})"
-
-                    # Pad names to ensure consistent alignment - account for double digit player counts
-                    name1 = f"{name1:<18}"
-                    name2 = f"{name2:<18}"
+                    # Pad names with remaining player counts to a fixed width so single digit (8/9)
+                    # and double digit (11/11) counts stay aligned
+                    name1 = f"{base_name1} ({team1_remaining})".ljust(SCOREBOARD_NAME_WIDTH)
+                    name2 = f"{base_name2} ({team2_remaining})".ljust(SCOREBOARD_NAME_WIDTH)
 
                     formatted_matchups.append({
                         'name1': name1,
@@ -3325,95 +3150,42 @@ async def scoreboard(interaction: discord.Interaction, auto_refresh: bool = True
                         'score2': score2
                     })
 
-                    # Track max length for dynamic spacing
-                    max_name_length = max(max_name_length, len(name1), len(name2))
-
-                # Use fixed spacing for consistent alignment across all leagues
-                # Account for double digit player counts: team names get 18 characters
-                left_spacing = 18
-
                 # Second pass: format with consistent spacing
-                for matchup_data in formatted_matchups:
-                    name1 = matchup_data['name1']
-                    name2 = matchup_data['name2']
-                    score1 = matchup_data['score1']
-                    score2 = matchup_data['score2']
-
-                    # Format scores consistently and determine winner
-                    score1_str = f"{score1:.1f}"
-                    score2_str = f"{score2:.1f}"
-
-                    # Add winner triangles while maintaining alignment
-                    if score1 > score2:
-                        # Team 1 winning
-                        line = f"{name1:<{left_spacing}} {score1_str:>6} ▶ |   {score2_str:<6} {name2}"
-                    elif score2 > score1:
-                        # Team 2 winning
-                        line = f"{name1:<{left_spacing}} {score1_str:>6}   | ◀ {score2_str:<6} {name2}"
-                    else:
-                        # Tied
-                        line = f"{name1:<{left_spacing}} {score1_str:>6}  |   {score2_str:<6} {name2}"
-
-                    all_table_lines.append(line)
-
-                # Split table into multiple embeds if needed
-                current_embed_lines = []
-
-                for line in all_table_lines:
-                    test_content = f"```\n{chr(10).join(current_embed_lines + [line])}\n```"
-
-                    if len(test_content) > SCOREBOARD_CHAR_LIMIT and current_embed_lines:
-                        # Create embed with current lines
-                        if current_embed_lines:
-                            # No table closure needed for simple text format
-
-                            table_embed = discord.Embed(
-                                title=f"📊 Matchups{f' (Part {len(embeds)})' if len(embeds) > 1 else ''}",
-                                color=0x32CD32
-                            )
-                            table_content = f"```\n{chr(10).join(current_embed_lines)}\n```"
-                            table_embed.add_field(name="Current Scores", value=table_content, inline=False)
-                            embeds.append(table_embed)
-
-                        # Start new embed
-                        current_embed_lines = []
-                        if not line.startswith("Team 1"):
-                            # Add header for continuation
-                            current_embed_lines.extend([
-                                "Team 1            | Score   | Team 2            | Score",
-                                "------------------|---------|-------------------|-------"
-                            ])
-
-                    current_embed_lines.append(line)
-
-                # Add final embed if there are remaining lines
-                if current_embed_lines:
-                    table_embed = discord.Embed(
-                        title=f"📊 Matchups{f' (Part {len(embeds)})' if len(embeds) > 1 else ''}",
-                        color=0x32CD32
-                    )
-                    table_content = f"```\n{chr(10).join(current_embed_lines)}\n```"
-                    table_embed.add_field(name="Current Scores", value=table_content, inline=False)
-                    embeds.append(table_embed)
+                all_table_lines = [
+                    format_scoreboard_line(m['name1'], m['score1'], m['score2'], m['name2'])
+                    for m in formatted_matchups
+                ]
+
+                # Split table into multiple embeds if needed, keeping the message within Discord's embed limits
+                embeds.extend(build_scoreboard_table_embeds(all_table_lines, sum(map(len, embeds))))
 
                 # Create summary embed
-                total_points = sum(m['score1'] + m['score2'] for m in matchups)
-                avg_game_total = total_points / len(matchups) if matchups else 0
-                highest_score = max(max(m['score1'], m['score2']) for m in matchups) if matchups else 0
-                closest_game = min(abs(m['score1'] - m['score2']) for m in matchups) if matchups else 0
+                # Total, highest score and closest margin in a single pass over the matchups
+                total_points = 0
+                highest_score = 0
+                closest_game = None
+                for m in matchups:
+                    score1, score2 = m['score1'], m['score2']
+                    total_points += score1 + score2
+                    highest_score = max(highest_score, score1, score2)
+                    margin = abs(score1 - score2)
+                    if closest_game is None or margin < closest_game:
+                        closest_game = margin
+                avg_game_total = total_points / len(matchups)
 
                 summary_embed = discord.Embed(
                     title="📋 Week Summary",
                     color=0x9932CC
                 )
 
-                summary_lines = []
-                summary_lines.append(f"🎯 **Total Points Scored**: {total_points:.1f}")
-                summary_lines.append(f"📈 **Average Game Total**: {avg_game_total:.1f}")
-                summary_lines.append(f"🔥 **Highest Individual Score**: {highest_score:.1f}")
-                summary_lines.append(f"⚡ **Closest Game**: {closest_game:.1f} point difference")
+                summary_text = "\n".join((
+                    f"🎯 **Total Points Scored**: {total_points:.1f}",
+                    f"📈 **Average Game Total**: {avg_game_total:.1f}",
+                    f"🔥 **Highest Individual Score**: {highest_score:.1f}",
+                    f"⚡ **Closest Game**: {closest_game:.1f} point difference",
+                ))
 
-                summary_embed.add_field(name="Stats", value="\n".join(summary_lines), inline=False)
+                summary_embed.add_field(name="Stats", value=summary_text, inline=False)
                 embeds.append(summary_embed)
 
             else:
@@ -3434,6 +3206,7 @@ async def scoreboard(interaction: discord.Interaction, auto_refresh: bool = True
             view = ScoreboardView(league, current_week, auto_refresh, user_id=interaction.user.id)
             message = await interaction.followup.send(embeds=embeds, view=view)
             view._message = message  # Store message reference for auto-refresh
+            view.last_embeds = embeds
         else:
             await interaction.followup.send(embeds=embeds)
 
@@ -3453,34 +3226,70 @@ class ScoreboardView(View):
         self.auto_refresh = auto_refresh
         self.user_id = user_id  # Store user ID to get current league on refresh
         self.last_refresh = None
+        self.last_refresh_key = None  # Scores and remaining-player counts shown by the last render
+        self.league_name = None  # Cached header name for the league currently shown
+        self.league_name_id = None
+        self.last_embeds = None  # Embeds from the last render, reused when only the header changes
+        self.refresh_stop_event = asyncio.Event()  # Set to wake and end the refresh loop immediately
 
         if auto_refresh:
             self.refresh_task = asyncio.create_task(self.auto_refresh_loop())
 
+    def get_league_display_name(self):
+        """Get the league name for headers, looked up once per league shown by this view"""
+        league_id = getattr(self.league, 'league_id', None)
+        if self.league_name is None or self.league_name_id != league_id:
+            self.league_name = get_league_name(user_id=self.user_id) if self.user_id else "Fantasy League"
+            self.league_name_id = league_id
+        return self.league_name
+
+    def stop_refresh(self):
+        """Turn auto-refresh off and cancel the background refresh task"""
+        self.auto_refresh = False
+        self.refresh_stop_event.set()
+        refresh_task = getattr(self, 'refresh_task', None)
+        if refresh_task and not refresh_task.done():
+            refresh_task.cancel()
+
     async def auto_refresh_loop(self):
         """Auto-refresh the scoreboard every 30 seconds"""
         try:
             while not self.is_finished():
-                await asyncio.sleep(30)  # Wait 30 seconds
+                # Wait 30 seconds, or stop right away if stop_refresh() is called
+                try:
+                    await asyncio.wait_for(self.refresh_stop_event.wait(), timeout=AUTO_REFRESH_INTERVAL)
+                    break
+                except asyncio.TimeoutError:
+                    pass
 
                 if not self.is_finished():
                     try:
                         # Create updated embeds with error handling
-                        embeds = self.create_updated_embeds()
+                        embeds = self.create_updated_embeds(skip_unchanged=True)
                     except Exception as e:
                         print(f"Error updating scoreboard: {e}")
                         # Continue the loop, skip this update
                         continue
 
+                    if embeds is None:
+                        # Nothing changed since the last refresh - only bump the header timestamp
+                        # so a quiet board still shows it was re-checked
+                        if not self.last_embeds:
+                            continue
+                        self.last_embeds[0].set_footer(text=time.strftime(SCOREBOARD_FOOTER_FORMAT))
+                        embeds = self.last_embeds
+
                     # Try to edit the message with enhanced error handling
                     try:
                         if hasattr(self, '_message') and self._message:
                             await self._message.edit(embeds=embeds, view=self)
                     except discord.errors.NotFound:
                         print("Auto-refresh stopped: Message was deleted")
+                        self.stop_refresh()
                         break
                     except discord.errors.Forbidden:
                         print("Auto-refresh stopped: No permission to edit message")
+                        self.stop_refresh()
                         break
                     except discord.errors.HTTPException as e:
                         print(f"Auto-refresh HTTP error: {e} - continuing...")
@@ -3495,8 +3304,8 @@ class ScoreboardView(View):
         except Exception as e:
             print(f"Auto-refresh loop error: {e}")
 
-    def create_updated_embeds(self):
-        """Create updated embeds with current scores"""
+    def create_updated_embeds(self, skip_unchanged=False):
+        """Create updated embeds with current scores (None if skip_unchanged and nothing changed)"""
         try:
             # Refresh league data using user's current default league
             if self.user_id:
@@ -3514,124 +3323,105 @@ class ScoreboardView(View):
             # Update the instance variable
             self.league = league
 
-            # Get updated matchups (same logic as main function)
-            matchups = []
-            teams_in_matchups = set()
-
-            for team in self.league.teams:
-                if team.team_id in teams_in_matchups:
-                    continue
+            # Week used for per-player stat lookups - read once per refresh
+            league_week = getattr(league, 'current_week', self.current_week)
 
-                # Find opponent
-                opponent = None
-                if hasattr(team, 'schedule') and len(team.schedule) >= self.current_week:
-                    try:
-                        week_opponent = team.schedule[self.current_week - 1]
-                        if hasattr(week_opponent, 'team_id'):
-                            opponent = week_opponent
-                        elif hasattr(week_opponent, 'opponent'):
-                            opponent = week_opponent.opponent
-                    except (IndexError, AttributeError):
-                        pass
-
-                # Alternative method: check box scores
-                if not opponent:
-                    try:
-                        box_score = self.league.box_scores(self.current_week)
-                        for matchup in box_score:
-                            if hasattr(matchup, 'home_team') and hasattr(matchup, 'away_team'):
-                                if matchup.home_team.team_id == team.team_id:
-                                    opponent = matchup.away_team
-                                    break
-                                elif matchup.away_team.team_id == team.team_id:
-                                    opponent = matchup.home_team
-                                    break
-                    except Exception:
-                        pass
+            # Get updated matchups
+            matchups = []
 
-                if opponent and opponent.team_id not in teams_in_matchups:
-                    # Try multiple methods to get current scores
-                    team_score = 0
-                    opponent_score = 0
+            # Walk each team's starters once: actual points for the score fallback and still-playing counts
+            starters_by_id = {}
+            actual_totals_by_id = {}
+            still_playing_by_id = {}
+            for t in self.league.teams:
+                starters = starters_by_id[t.team_id] = [p for p in t.roster if getattr(p, 'lineupSlot', None) != "BE"]
+                actual_total = 0
+                still_playing = 0
+                for player in starters:
+                    actual_total += get_actual_points_only(player, league_week)
+                    proj_points = get_current_week_points(player, league)
+                    if proj_points != 'N/A' and proj_points > 0:
+                        still_playing += 1
+                actual_totals_by_id[t.team_id] = actual_total
+                still_playing_by_id[t.team_id] = still_playing
+
+            # Each box score is one matchup: (team, opponent, team_score, opponent_score)
+            matchup_pairs = []
+            try:
+                for box_score in self.league.box_scores(self.current_week):
+                    home_team = getattr(box_score, 'home_team', None)
+                    away_team = getattr(box_score, 'away_team', None)
+                    if hasattr(home_team, 'team_id') and hasattr(away_team, 'team_id'):
+                        home_score = getattr(box_score.home_score, 'total_points', 0) or getattr(box_score, 'home_score', 0)
+                        away_score = getattr(box_score.away_score, 'total_points', 0) or getattr(box_score, 'away_score', 0)
+                        matchup_pairs.append((home_team, away_team, home_score, away_score))
+            except Exception as e:
+                print(f"Box score refresh method failed: {e}")
 
-                    # Method 1: Try box scores API
-                    try:
-                        box_scores = self.league.box_scores(self.current_week)
-                        for box_score in box_scores:
-                            if hasattr(box_score, 'home_team') and hasattr(box_score, 'away_team'):
-                                if box_score.home_team.team_id == team.team_id:
-                                    team_score = getattr(box_score.home_score, 'total_points', 0) or getattr(box_score, 'home_score', 0)
-                                    opponent_score = getattr(box_score.away_score, 'total_points', 0) or getattr(box_score, 'away_score', 0)
-                                    break
-                                elif box_score.away_team.team_id == team.team_id:
-                                    team_score = getattr(box_score.away_score, 'total_points', 0) or getattr(box_score, 'away_score', 0)
-                                    opponent_score = getattr(box_score.home_score, 'total_points', 0) or getattr(box_score, 'home_score', 0)
-                                    break
-                    except Exception as e:
-                        print(f"Box score refresh method failed: {e}")
-                        pass
+            # Alternative method: pair teams from their schedules if box scores are unavailable
+            if not matchup_pairs:
+                teams_in_matchups = set()
+                for team in self.league.teams:
+                    if team.team_id in teams_in_matchups:
+                        continue
 
-                    # Method 2: Try team.scores if box scores didn't work
-                    if team_score == 0 and opponent_score == 0:
+                    opponent = None
+                    if hasattr(team, 'schedule') and len(team.schedule) >= self.current_week:
                         try:
-                            if hasattr(team, 'scores') and len(team.scores) >= self.current_week:
-                                team_score = team.scores[self.current_week - 1] or 0
-                            if hasattr(opponent, 'scores') and len(opponent.scores) >= self.current_week:
-                                opponent_score = opponent.scores[self.current_week - 1] or 0
+                            week_opponent = team.schedule[self.current_week - 1]
+                            if hasattr(week_opponent, 'team_id'):
+                                opponent = week_opponent
+                            elif hasattr(week_opponent, 'opponent'):
+                                opponent = week_opponent.opponent
                         except (IndexError, AttributeError):
                             pass
 
-                    # Method 3: Calculate actual points only (no projected scores)
-                    if team_score == 0 and opponent_score == 0:
-                        def get_actual_points_only(player, league_ref):
-                            """Get only actual points, not projected"""
-                            current_week = getattr(league_ref, 'current_week', 1)
-                            if hasattr(player, 'stats') and player.stats:
-                                try:
-                                    week_stats = player.stats.get(current_week, {})
-                                    actual_points = week_stats.get('points', None)
-                                    if actual_points is not None and actual_points > 0:
-                                        return actual_points
-
-                                    # Check applied stats for actual game performance
-                                    applied_stats = week_stats.get('appliedStats', {})
-                                    if applied_stats and len(applied_stats) > 0:
-                                        # Calculate points from actual stats if available
-                                        total_points = 0
-                                        for stat_id, value in applied_stats.items():
-                                            if isinstance(value, (int, float)) and value > 0:
-                                                total_points += value
-                                        if total_points > 0:
-                                            return total_points
-                                except:
-                                    pass
-                            return 0
-
-                        starters = [p for p in team.roster if getattr(p, 'lineupSlot', None) != "BE"]
-                        team_score = sum(get_actual_points_only(p, self.league) for p in starters)
-
-                        opp_starters = [p for p in opponent.roster if getattr(p, 'lineupSlot', None) != "BE"]
-                        opponent_score = sum(get_actual_points_only(p, self.league) for p in opp_starters)
+                    if opponent and opponent.team_id not in teams_in_matchups:
+                        matchup_pairs.append((team, opponent, 0, 0))
+                        teams_in_matchups.add(team.team_id)
+                        teams_in_matchups.add(opponent.team_id)
 
-                    matchups.append({
-                        'team1': team,
-                        'team2': opponent,
-                        'score1': team_score,
-                        'score2': opponent_score
-                    })
+            for team, opponent, team_score, opponent_score in matchup_pairs:
+                # Method 2: Try team.scores if box scores didn't work
+                if team_score == 0 and opponent_score == 0:
+                    try:
+                        if hasattr(team, 'scores') and len(team.scores) >= self.current_week:
+                            team_score = team.scores[self.current_week - 1] or 0
+                        if hasattr(opponent, 'scores') and len(opponent.scores) >= self.current_week:
+                            opponent_score = opponent.scores[self.current_week - 1] or 0
+                    except (IndexError, AttributeError):
+                        pass
 
-                    teams_in_matchups.add(team.team_id)
-                    teams_in_matchups.add(opponent.team_id)
+                # Method 3: Calculate actual points only (no projected scores)
+                if team_score == 0 and opponent_score == 0:
+                    team_score = actual_totals_by_id.get(team.team_id, 0)
+                    opponent_score = actual_totals_by_id.get(opponent.team_id, 0)
+
+                matchups.append({
+                    'team1': team,
+                    'team2': opponent,
+                    'score1': team_score,
+                    'score2': opponent_score
+                })
 
             # Sort matchups by total points (most exciting games first)
             matchups.sort(key=lambda m: m['score1'] + m['score2'], reverse=True)
 
+            # Skip rebuilding when no score or remaining-player count has changed since the last refresh
+            refresh_key = tuple(
+                (m['team1'].team_id, m['score1'], still_playing_by_id.get(m['team1'].team_id),
+                 m['team2'].team_id, m['score2'], still_playing_by_id.get(m['team2'].team_id))
+                for m in matchups
+            )
+            if skip_unchanged and refresh_key == self.last_refresh_key:
+                return None
+
             # Create individual embeds for each matchup
             embeds = []
 
             if matchups:
                 # Create header embed
-                league_name = get_league_name(user_id=self.user_id)
+                league_name = self.get_league_display_name()
                 header_embed = discord.Embed(
                     title=f"🏈 {league_name} Live Scoreboard",
                     description=f"Week {self.current_week} Matchups • {('🔄 Auto-refresh ON' if self.auto_refresh else '📊 Static view')}",
@@ -3639,54 +3429,14 @@ class ScoreboardView(View):
                 )
 
                 # Add refresh timestamp
-                import datetime
-                now = datetime.datetime.now()
-                header_embed.set_footer(text=f"Last updated: {now.strftime('%I:%M:%S %p')}")
+                header_embed.set_footer(text=time.strftime(SCOREBOARD_FOOTER_FORMAT))
                 embeds.append(header_embed)
 
-                # Get remaining players info function
-                def get_remaining_players(team, league_ref):
-                    starters = [p for p in team.roster if getattr(p, 'lineupSlot', None) != "BE"]
-                    still_playing = 0
-                    total_starters = len(starters)
-
-                    for player in starters:
-                        proj_points = get_current_week_points(player, league_ref)
-                        if proj_points != 'N/A' and proj_points > 0:
-                            still_playing += 1
-
-                    # For demo, randomize a bit to show realistic variations
-                    import random
-                    if still_playing == total_starters:
-                        still_playing = random.randint(max(1, total_starters-3), total_starters)
-
-                    return f"{still_playing}/{total_starters}"
-
-                # Helper function to format team names
-                def format_team_name(name, max_length=14):
-                    if len(name) <= max_length:
-                        return name
-
-                    words = name.split()
-                    if len(words) == 1:
-                        return name[:max_length-1] + "."
-
-                    # Two or more words: first word + first letter of second word only
-                    if len(words) >= 2:
-                        result = f"{words[0]} {words[1][0]}."
-                        if len(result) <= max_length:
-                            return result
-                        else:
-                            return words[0][:max_length-3] + " " + words[1][0] + "."
-
-                    return words[0][:max_length-1] + "."
-
-                # Build simple vs-style lines
+                # Build simple vs-style lines and the week summary totals in a single pass over the matchups
                 all_table_lines = []
-
-                # First pass: calculate the longest team name to determine optimal spacing
-                max_name_length = 0
-                formatted_matchups = []
+                total_points = 0
+                highest_score = 0
+                closest_game = None
 
                 for matchup in matchups:
                     team1 = matchup['team1']
@@ -3695,122 +3445,50 @@ class ScoreboardView(View):
                     score2 = matchup['score2']
 
                     # Get remaining players for each team first
-                    team1_remaining = get_remaining_players(team1, league)
-                    team2_remaining = get_remaining_players(team2, league)
+                    team1_remaining = f"{still_playing_by_id[team1.team_id]}/{len(starters_by_id[team1.team_id])}"
+                    team2_remaining = f"{still_playing_by_id[team2.team_id]}/{len(starters_by_id[team2.team_id])}"
 
                     # Format team names with balanced length for better identification while maintaining alignment
                     base_name1 = format_team_name(team1.team_name, 9)
                     base_name2 = format_team_name(team2.team_name, 9)
 
-                    # Ensure consistent formatting by padding remaining player counts
-                    # This handles both single digit (8/9) and double digit (11/11) counts
-                    name1 = f"{base_name1} ({team1_remaining})"
-                    name2 = f"{base_name2} ({team2_remaining})"
-
-                    # Pad names to ensure consistent alignment - account for double digit player counts
-                    name1 = f"{name1:<18}"
-                    name2 = f"{name2:<18}"
+                    # Pad names with remaining player counts to a fixed width so single digit (8/9)
+                    # and double digit (11/11) counts stay aligned
+                    name1 = f"{base_name1} ({team1_remaining})".ljust(SCOREBOARD_NAME_WIDTH)
+                    name2 = f"{base_name2} ({team2_remaining})".ljust(SCOREBOARD_NAME_WIDTH)
 
-                    formatted_matchups.append({
-                        'name1': name1,
-                        'name2': name2,
-                        'score1': score1,
-                        'score2': score2
-                    })
+                    all_table_lines.append(format_scoreboard_line(name1, score1, score2, name2))
 
-                    # Track max length for dynamic spacing
-                    max_name_length = max(max_name_length, len(name1), len(name2))
+                    # Week summary totals
+                    total_points += score1 + score2
+                    highest_score = max(highest_score, score1, score2)
+                    margin = abs(score1 - score2)
+                    if closest_game is None or margin < closest_game:
+                        closest_game = margin
 
-                # Use fixed spacing for consistent alignment across all leagues
-                # Account for double digit player counts: team names get 18 characters
-                left_spacing = 18
-
-                # Second pass: format with consistent spacing
-                for matchup_data in formatted_matchups:
-                    name1 = matchup_data['name1']
-                    name2 = matchup_data['name2']
-                    score1 = matchup_data['score1']
-                    score2 = matchup_data['score2']
-
-                    # Format scores consistently and determine winner
-                    score1_str = f"{score1:.1f}"
-                    score2_str = f"{score2:.1f}"
-
-                    # Add winner triangles while maintaining alignment
-                    if score1 > score2:
-                        # Team 1 winning
-                        line = f"{name1:<{left_spacing}} {score1_str:>6} ▶ |   {score2_str:<6} {name2}"
-                    elif score2 > score1:
-                        # Team 2 winning
-                        line = f"{name1:<{left_spacing}} {score1_str:>6}   | ◀ {score2_str:<6} {name2}"
-                    else:
-                        # Tied
-                        line = f"{name1:<{left_spacing}} {score1_str:>6}  |   {score2_str:<6} {name2}"
-
-                    all_table_lines.append(line)
-
-                # Split table into multiple embeds if needed
-                current_embed_lines = []
-
-                for line in all_table_lines:
-                    test_content = f"```\n{chr(10).join(current_embed_lines + [line])}\n```"
-
-                    if len(test_content) > SCOREBOARD_CHAR_LIMIT and current_embed_lines:
-                        # Create embed with current lines
-                        if current_embed_lines:
-                            # No table closure needed for simple text format
-
-                            table_embed = discord.Embed(
-                                title=f"📊 Matchups{f' (Part {len(embeds)})' if len(embeds) > 1 else ''}",
-                                color=0x32CD32
-                            )
-                            table_content = f"```\n{chr(10).join(current_embed_lines)}\n```"
-                            table_embed.add_field(name="Current Scores", value=table_content, inline=False)
-                            embeds.append(table_embed)
-
-                        # Start new embed
-                        current_embed_lines = []
-                        if not line.startswith("Team 1"):
-                            # Add header for continuation
-                            current_embed_lines.extend([
-                                "Team 1            | Score   | Team 2            | Score",
-                                "------------------|---------|-------------------|-------"
-                            ])
-
-                    current_embed_lines.append(line)
-
-                # Add final embed if there are remaining lines
-                if current_embed_lines:
-                    table_embed = discord.Embed(
-                        title=f"📊 Matchups{f' (Part {len(embeds)})' if len(embeds) > 1 else ''}",
-                        color=0x32CD32
-                    )
-                    table_content = f"```\n{chr(10).join(current_embed_lines)}\n```"
-                    table_embed.add_field(name="Current Scores", value=table_content, inline=False)
-                    embeds.append(table_embed)
+                # Split table into multiple embeds if needed, keeping the message within Discord's embed limits
+                embeds.extend(build_scoreboard_table_embeds(all_table_lines, sum(map(len, embeds))))
 
                 # Create summary embed
-                total_points = sum(m['score1'] + m['score2'] for m in matchups)
-                avg_game_total = total_points / len(matchups) if matchups else 0
-                highest_score = max(max(m['score1'], m['score2']) for m in matchups) if matchups else 0
-                closest_game = min(abs(m['score1'] - m['score2']) for m in matchups) if matchups else 0
+                avg_game_total = total_points / len(matchups)
 
                 summary_embed = discord.Embed(
                     title="📋 Week Summary",
                     color=0x9932CC
                 )
 
-                summary_lines = []
-                summary_lines.append(f"🎯 **Total Points Scored**: {total_points:.1f}")
-                summary_lines.append(f"📈 **Average Game Total**: {avg_game_total:.1f}")
-                summary_lines.append(f"🔥 **Highest Individual Score**: {highest_score:.1f}")
-                summary_lines.append(f"⚡ **Closest Game**: {closest_game:.1f} point difference")
+                summary_text = "\n".join((
+                    f"🎯 **Total Points Scored**: {total_points:.1f}",
+                    f"📈 **Average Game Total**: {avg_game_total:.1f}",
+                    f"🔥 **Highest Individual Score**: {highest_score:.1f}",
+                    f"⚡ **Closest Game**: {closest_game:.1f} point difference",
+                ))
 
-                summary_embed.add_field(name="Stats", value="\n".join(summary_lines), inline=False)
+                summary_embed.add_field(name="Stats", value=summary_text, inline=False)
                 embeds.append(summary_embed)
 
             else:
-                league_name = get_league_name(user_id=self.user_id) if self.user_id else "Fantasy League"
+                league_name = self.get_league_display_name()
                 error_embed = discord.Embed(
                     title=f"🏈 {league_name} Live Scoreboard",
                     description="❌ No matchups found for this week.",
@@ -3818,8 +3496,11 @@ class ScoreboardView(View):
                 )
                 embeds.append(error_embed)
 
+            self.last_refresh_key = refresh_key
+            self.last_embeds = embeds
+
         except Exception as e:
-            league_name = get_league_name(user_id=self.user_id) if self.user_id else "Fantasy League"
+            league_name = self.get_league_display_name()
             error_embed = discord.Embed(
                 title=f"🏈 {league_name} Live Scoreboard",
                 description=f"❌ Failed to refresh: {e}",
@@ -3846,19 +3527,22 @@ class ScoreboardView(View):
         await interaction.response.defer()
 
         if self.auto_refresh:
-            self.auto_refresh = False
-            if hasattr(self, 'refresh_task'):
-                self.refresh_task.cancel()
+            self.stop_refresh()
             button.label = "▶️ Start Auto-Refresh"
             button.style = discord.ButtonStyle.success
         else:
             self.auto_refresh = True
+            self.refresh_stop_event.clear()
             self.refresh_task = asyncio.create_task(self.auto_refresh_loop())
             button.label = "⏸️ Stop Auto-Refresh"
             button.style = discord.ButtonStyle.secondary
 
-        # Update embeds
-        embeds = self.create_updated_embeds()
+        # Stopping only changes the header description, so reuse the last render;
+        # starting re-renders so the board doesn't resume with old scores and an old timestamp
+        if self.auto_refresh or not self.last_embeds:
+            embeds = self.create_updated_embeds()
+        else:
+            embeds = self.last_embeds
         # Update header embed description
         if embeds:
             embeds[0].description = f"Week {self.current_week} Matchups • {('🔄 Auto-refresh ON' if self.auto_refresh else '📊 Static view')}"
@@ -3867,8 +3551,7 @@ class ScoreboardView(View):
 
     async def on_timeout(self):
         """Handle view timeout"""
-        if hasattr(self, 'refresh_task'):
-            self.refresh_task.cancel()
+        self.stop_refresh()
 
 # Interactive View for Team Command
 class TeamView(View):
@@ -3904,44 +3587,25 @@ class FilterByPositionButton(Button):
         def get_points(player):
             return get_current_week_points(player, self.view.league)
         
-        def get_proj(player):
-            return (
-                getattr(player, 'projected_points', None)
-                or getattr(player, 'projected_total_points', None)
-                or getattr(player, 'proj_score', None)
-                or 'N/A'
-            )
-
         def player_row(player):
+            # Use position abbreviation instead of emoji
             pos = getattr(player, 'position', 'UNK')
             name = f"{pos} {player.name}"
-            actual = str(get_points(player))
-            if actual == 'N/A':
-                points_display = "  N/A"
+            points = get_points(player)
+            if points == 'N/A':
+                points_str = "N/A pts"
             else:
-                points_display = f"{float(actual):5.2f}"
-            return [name, f"{points_display} pts"]
+                points_str = f"{float(points):5.2f} pts"
+            return f"{name:<22} {points_str:>9}"
         
         # Create custom formatted table for filtered players
         filter_header = f"{'Player':<22} {'Projected':>9}"
         filter_separator = f"{'-'*22} {'-'*9}"
 
         filter_lines = [filter_header, filter_separator]
-        for p in filtered_players:
-            # Use position abbreviation instead of emoji
-            pos = getattr(p, 'position', 'UNK')
-            name = f"{pos} {p.name}"
-            points = get_points(p)
-
-            if points == 'N/A':
-                points_str = "N/A pts"
-            else:
-                points_str = f"{float(points):5.2f} pts"
+        filter_lines.extend(player_row(p) for p in filtered_players)
 
-            line = f"{name:<22} {points_str:>9}"
-            filter_lines.append(line)
-
-        players_text = f"```\n{chr(10).join(filter_lines)}\n```"
+        players_text = "```\n" + "\n".join(filter_lines) + "\n```"
         
         embed = discord.Embed(title=f"🏈 {self.view.team.team_name} - {self.position} Players", color=discord.Color.blue())
         embed.add_field(name=f"{self.position} Players", value=players_text, inline=False)
@@ -3956,39 +3620,23 @@ class ShowAllButton(Button):
         # Re-send the original team roster
         await interaction.response.defer()
         
-        # Recreate the original team command logic
-        pos_emoji = {
-            'QB': '🏈', 'RB': '🏃', 'WR': '🏃', 'TE': '🧩', 'K': '🦶', 'D/ST': '🛡️', 'DST': '🛡️', 'DEF': '🛡️', 'Bench': '🪑', 'BE': '🪑', 'IR': '🏥'
-        }
-        status_emoji = {
-            'ACTIVE': '✅', 'QUESTIONABLE': '⚠️', 'OUT': '❌', 'INJURY_RESERVE': '🏥', 'NORMAL': '🔵', None: ''
-        }
-        status_abbrev = {
-            'ACTIVE': 'A', 'QUESTIONABLE': 'Q', 'OUT': 'O', 'INJURY_RESERVE': 'IR', 'NORMAL': 'N', None: ''
-        }
+        # Resolve each player's current week points once for the totals and the roster lines
+        points_by_player = {id(p): get_current_week_points(p, self.view.league) for p in self.view.team.roster}
 
         def get_points(player):
-            return get_current_week_points(player, self.view.league)
-        
-        def get_proj(player):
-            return (
-                getattr(player, 'projected_points', None)
-                or getattr(player, 'projected_total_points', None)
-                or getattr(player, 'proj_score', None)
-                or 'N/A'
-            )
+            return points_by_player[id(player)]
         
         def get_status(player):
             # Don't show status for D/ST positions
             pos = getattr(player, 'position', '')
-            if pos in ['D/ST', 'DST', 'DEF']:
+            if pos in DST_POSITIONS:
                 return ''
 
             status = getattr(player, 'injuryStatus', None)
-            abbrev = status_abbrev.get(status, status_abbrev.get('NORMAL', ''))
+            abbrev = ROSTER_STATUS_ABBREVS.get(status, ROSTER_STATUS_ABBREVS['NORMAL'])
 
             # Don't show status for Available players (A or N)
-            if abbrev in ['A', 'N']:
+            if abbrev in HIDDEN_STATUS_ABBREVS:
                 return ''
 
             return abbrev
@@ -4007,20 +3655,22 @@ class ShowAllButton(Button):
             # Use consistent formatting
             return f"{name:<22} {status:<8} {points_display:>9}"
         
-        starters = [p for p in self.view.team.roster if getattr(p, 'lineupSlot', None) != "BE"]
-        bench = [p for p in self.view.team.roster if getattr(p, 'lineupSlot', None) == "BE"]
+        # Split the roster into starters and bench in a single pass
+        starters, bench = [], []
+        for p in self.view.team.roster:
+            (bench if getattr(p, 'lineupSlot', None) == "BE" else starters).append(p)
         
-        total_starter_points = sum(float(get_points(p)) for p in starters if get_points(p) != 'N/A')
+        total_starter_points = sum(float(points) for points in map(get_points, starters) if points != 'N/A')
         
-        starters_text = f"""```
-{chr(10).join(player_line(p) for p in starters)}
-────────────────────────────────────────────
-Total Starter Points: {total_starter_points:.2f}
-```""" if starters else "None"
+        starter_lines = [player_line(p) for p in starters]
+        bench_lines = [player_line(p) for p in bench]
         
-        bench_text = f"""```
-{chr(10).join(player_line(p) for p in bench)}
-```""" if bench else "None"
+        starters_text = (
+            "```\n" + "\n".join(starter_lines)
+            + f"\n────────────────────────────────────────────\nTotal Starter Points: {total_starter_points:.2f}\n```"
+        ) if starters else "None"
+        
+        bench_text = "```\n" + "\n".join(bench_lines) + "\n```" if bench else "None"
         
         current_week = getattr(self.view.league, 'current_week', 'Unknown')
         embed = discord.Embed(title=f"🏈 {self.view.team.team_name} Roster - Week {current_week}", color=discord.Color.blue())
@@ -4037,23 +3687,26 @@ Total Starter Points: {total_starter_points:.2f}
 
 class PlayerSelectDropdown(Select):
     def __init__(self, team):
-        # Create options for all players on the team
-        options = []
-        for player in team.roster:
-            options.append(discord.SelectOption(
+        # Create options for the first 25 players on the team (Discord limit)
+        options = [
+            discord.SelectOption(
                 label=player.name,
                 description=f"{player.position} - {player.proTeam}",
                 value=player.name
-            ))
+            )
+            for player in team.roster[:25]
+        ]
         
-        super().__init__(placeholder="Select a player for details...", options=options[:25])  # Discord limit
+        super().__init__(placeholder="Select a player for details...", options=options)
         self.team = team
+        # Name index for the selection lookup (first player wins on duplicate names)
+        self.players_by_name = {player.name: player for player in reversed(team.roster)}
     
     async def callback(self, interaction: discord.Interaction):
         selected_player_name = self.values[0]
         
         # Find the selected player
-        selected_player = next((p for p in self.team.roster if p.name == selected_player_name), None)
+        selected_player = self.players_by_name.get(selected_player_name)
         
         if not selected_player:
             await interaction.response.send_message("Player not found.", ephemeral=True)
@@ -4063,14 +3716,6 @@ class PlayerSelectDropdown(Select):
         def get_points(player):
             return get_current_week_points(player, self.view.league)
         
-        def get_proj(player):
-            return (
-                getattr(player, 'projected_points', None)
-                or getattr(player, 'projected_total_points', None)
-                or getattr(player, 'proj_score', None)
-                or 'N/A'
-            )
-        
         # Try different opponent attribute names
         opponent = (
             getattr(selected_player, 'opponent', None) or
@@ -4081,7 +3726,7 @@ class PlayerSelectDropdown(Select):
         )
         
         actual_points = get_points(selected_player)
-        proj_points = get_proj(selected_player)
+        proj_points = get_projected_points(selected_player)
         season_total = getattr(selected_player, 'total_points', 'N/A')
         injury_status = getattr(selected_player, 'injuryStatus', 'N/A')
         nfl_team = getattr(selected_player, 'proTeam', 'N/A')
@@ -4155,7 +3800,7 @@ async def my_leagues(interaction: discord.Interaction):
     try:
         await interaction.response.defer(ephemeral=True)
 
-        user_leagues = league_manager.get_user_leagues(interaction.user.id)
+        user_leagues, default_league_key = league_manager.get_user_context(interaction.user.id)
 
         if not user_leagues:
             embed = discord.Embed(
@@ -4172,9 +3817,8 @@ async def my_leagues(interaction: discord.Interaction):
             color=0x0099ff
         )
 
-        # Get user's default league
-        user_data = league_manager.data['users'].get(str(interaction.user.id), {})
-        default_league_key = user_data.get('default_league')
+        # Use inline for 1-2 leagues, full width for more
+        inline_fields = len(user_leagues) <= 2
 
         for i, league_info in enumerate(user_leagues, 1):
             league_key = f"{league_info['league_id']}_{league_info['owner_id']}"
@@ -4191,17 +3835,15 @@ async def my_leagues(interaction: discord.Interaction):
             # Privacy indicator with better formatting
             privacy_status = "🔒 Private" if league_info['swid'] and league_info['espn_s2'] else "🌐 Public"
 
-            field_value = f"{league_name}\n"
-            field_value += f"🆔 **League ID:** `{league_info['league_id']}`\n"
-            field_value += f"📅 **Year:** {league_info['year']}\n"
-            field_value += f"{privacy_status}"
-
-            embed.add_field(
-                name=f"{i}. League Details{name_suffix}",
-                value=field_value,
-                inline=len(user_leagues) <= 2  # Use inline for 1-2 leagues, full width for more
+            field_value = (
+                f"{league_name}\n"
+                f"🆔 **League ID:** `{league_info['league_id']}`\n"
+                f"📅 **Year:** {league_info['year']}\n"
+                f"{privacy_status}"
             )
 
+            embed.add_field(name=f"{i}. League Details{name_suffix}", value=field_value, inline=inline_fields)
+
         embed.add_field(
             name="💡 Tips",
             value="• Use `/switch_league` to change your default league\n• Use `/remove_league` to remove a league\n• All commands will use your default league",
@@ -4229,16 +3871,10 @@ async def switch_league(interaction: discord.Interaction, league_name: str):
             return
 
         # Find the league by name
-        target_league = None
-        target_league_key = None
-        for league_info in user_leagues:
-            if league_info['name'].lower() == league_name.lower():
-                target_league = league_info
-                target_league_key = f"{league_info['league_id']}_{league_info['owner_id']}"
-                break
+        target_league, target_league_key = find_user_league(user_leagues, league_name)
 
         if not target_league:
-            available_leagues = ", ".join([league['name'] for league in user_leagues])
+            available_leagues = ", ".join(league['name'] for league in user_leagues)
             await interaction.followup.send(f"❌ League '{league_name}' not found.\n\nAvailable leagues: {available_leagues}", ephemeral=True)
             return
 
@@ -4275,16 +3911,10 @@ async def remove_league(interaction: discord.Interaction, league_name: str):
             return
 
         # Find the league by name
-        target_league = None
-        target_league_key = None
-        for league_info in user_leagues:
-            if league_info['name'].lower() == league_name.lower():
-                target_league = league_info
-                target_league_key = f"{league_info['league_id']}_{league_info['owner_id']}"
-                break
+        target_league, target_league_key = find_user_league(user_leagues, league_name)
 
         if not target_league:
-            available_leagues = ", ".join([league['name'] for league in user_leagues])
+            available_leagues = ", ".join(league['name'] for league in user_leagues)
             await interaction.followup.send(f"❌ League '{league_name}' not found.\n\nAvailable leagues: {available_leagues}", ephemeral=True)
             return
 
@@ -4318,9 +3948,7 @@ async def league_status(interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
 
         # Get user's league info
-        user_leagues = league_manager.get_user_leagues(interaction.user.id)
-        user_data = league_manager.data['users'].get(str(interaction.user.id), {})
-        default_league_key = user_data.get('default_league')
+        user_leagues, default_league_key = league_manager.get_user_context(interaction.user.id)
 
         embed = discord.Embed(
             title="🏈 League Status",
@@ -4335,14 +3963,8 @@ async def league_status(interaction: discord.Interaction):
                 inline=False
             )
         else:
-            # Find default league info
-            default_league_info = None
-            if default_league_key:
-                for league_info in user_leagues:
-                    league_key = f"{league_info['league_id']}_{league_info['owner_id']}"
-                    if league_key == default_league_key:
-                        default_league_info = league_info
-                        break
+            # Find default league info - the default key always names one of the user's own leagues
+            default_league_info = league_manager.data['leagues'].get(default_league_key) if default_league_key else None
 
             if default_league_info:
                 embed.description = f"✅ **Active League:** {default_league_info['name']}"
@@ -4407,33 +4029,37 @@ async def all_leagues(interaction: discord.Interaction):
             color=0x0099ff
         )
 
+        # Use inline for 1-2 leagues, full width for more
+        inline_fields = len(all_leagues) <= 2
+
+        # Resolve each distinct owner's display name once (no guild in DMs, owner ids are stored as digit strings)
+        owner_names = {}
+        if interaction.guild:
+            for owner_id in {str(league_info['owner_id']) for league_info in all_leagues}:
+                if owner_id.isdigit():
+                    owner = interaction.guild.get_member(int(owner_id))
+                    if owner:
+                        owner_names[owner_id] = owner.display_name
+
         for i, league_info in enumerate(all_leagues, 1):
             # Get owner's username if possible
-            owner_name = None
-            try:
-                owner = interaction.guild.get_member(int(league_info['owner_id']))
-                if owner:
-                    owner_name = owner.display_name
-            except:
-                pass
+            owner_name = owner_names.get(str(league_info['owner_id']))
 
             # Privacy indicator
             privacy_status = "🔒 Private" if league_info.get('swid') and league_info.get('espn_s2') else "🌐 Public"
 
-            field_value = f"🏈 **{league_info['name']}**\n"
-            field_value += f"🆔 **League ID:** `{league_info['league_id']}`\n"
-            field_value += f"📅 **Year:** {league_info['year']}\n"
-            field_value += f"{privacy_status}"
+            field_value = (
+                f"🏈 **{league_info['name']}**\n"
+                f"🆔 **League ID:** `{league_info['league_id']}`\n"
+                f"📅 **Year:** {league_info['year']}\n"
+                f"{privacy_status}"
+            )
 
             # Only show "Registered by" if we have a meaningful name
             if owner_name:
                 field_value += f"\n👤 **Registered by:** {owner_name}"
 
-            embed.add_field(
-                name=f"{i}. League Details",
-                value=field_value,
-                inline=len(all_leagues) <= 2  # Use inline for 1-2 leagues, full width for more
-            )
+            embed.add_field(name=f"{i}. League Details", value=field_value, inline=inline_fields)
 
         embed.add_field(
             name="💡 How to Use",
@@ -4458,7 +4084,7 @@ async def compare_cross_league(interaction: discord.Interaction, team1: str, tea
     try:
         await interaction.response.defer()
 
-        # Get leagues for comparison
+        # Resolve both league names first, so the ESPN fetches only start once both are known
         if league1:
             # Find league by name
             league1_matches = league_manager.find_leagues_by_name(league1)
@@ -4467,52 +4093,76 @@ async def compare_cross_league(interaction: discord.Interaction, team1: str, tea
                 available_names = [l['name'] for l in all_leagues]
                 await interaction.followup.send(f"❌ League '{league1}' not found.\n\nAvailable leagues: {', '.join(available_names)}")
                 return
-            league1_obj = league_manager.get_league_by_key(league1_matches[0]['key'])
-            if not league1_obj:
-                await interaction.followup.send(f"❌ Failed to connect to league '{league1_matches[0]['name']}'.")
-                return
+            league1_key = league1_matches[0]['key']
             league1_name = league1_matches[0]['name']
+            league1_info = dict(league_manager.data['leagues'][league1_key])
+
+            def load_league1():
+                return league_manager.connect_league(league1_info)
         else:
             # Use user's default league
-            league1_obj = get_league(user_id=interaction.user.id)
-            if not league1_obj:
-                await interaction.followup.send("❌ No default league found. Register a league or specify league1 parameter.")
-                return
-            # Get league name
-            user_leagues = league_manager.get_user_leagues(interaction.user.id)
-            user_data = league_manager.data['users'].get(str(interaction.user.id), {})
-            default_league_key = user_data.get('default_league')
-            if default_league_key and default_league_key in league_manager.data['leagues']:
-                league1_name = league_manager.data['leagues'][default_league_key]['name']
+            _, league1_key = league_manager.get_user_context(interaction.user.id)
+            if league1_key and league1_key in league_manager.data['leagues']:
+                league1_info = dict(league_manager.data['leagues'][league1_key])
+                league1_name = league1_info['name']
             else:
+                league1_info = None
                 league1_name = "Your League"
 
+            def load_league1():
+                # Same as get_league(user_id=...) - fall back to the bot's default league if the user's can't connect
+                return (league1_info and league_manager.connect_league(league1_info)) or get_league()
+
+        league2_key = None
         if league2:
             # Find league by name
             league2_matches = league_manager.find_leagues_by_name(league2)
             if not league2_matches:
                 await interaction.followup.send(f"❌ League '{league2}' not found. Use `/all_leagues` to see available leagues.")
                 return
-            league2_obj = league_manager.get_league_by_key(league2_matches[0]['key'])
+            league2_key = league2_matches[0]['key']
             league2_name = league2_matches[0]['name']
+            league2_info = dict(league_manager.data['leagues'][league2_key])
         else:
             # Use user's default league (same as league1 if not specified)
-            league2_obj = league1_obj
             league2_name = league1_name
 
+        # espn_api is blocking - fetch two different leagues in worker threads so their round trips overlap.
+        # The stored league records were copied above on the event loop, so the threads never read
+        # league_manager.data, and these fetches are uncached so they never touch the league cache
+        if league2_key and league2_key != league1_key:
+            league1_obj, league2_obj = await asyncio.gather(
+                asyncio.to_thread(load_league1),
+                asyncio.to_thread(league_manager.connect_league, league2_info)
+            )
+        else:
+            league1_obj = await asyncio.to_thread(load_league1)
+            league2_obj = league1_obj
+
+        if not league1_obj:
+            if league1:
+                await interaction.followup.send(f"❌ Failed to connect to league '{league1_name}'.")
+            else:
+                await interaction.followup.send("❌ No default league found. Register a league or specify league1 parameter.")
+            return
+
         if not league1_obj or not league2_obj:
             await interaction.followup.send("❌ Failed to connect to one or both leagues.")
             return
 
         # Find teams
-        team1_obj = next((t for t in league1_obj.teams if t.team_name.lower() == team1.lower()), None)
-        team2_obj = next((t for t in league2_obj.teams if t.team_name.lower() == team2.lower()), None)
+        team1_obj = get_team_name_index(league1_obj).get(team1.lower())
+        team2_obj = get_team_name_index(league2_obj).get(team2.lower())
 
         if not team1_obj:
-            await interaction.followup.send(f"❌ Team '{team1}' not found in {league1_name}.")
+            suggestion = suggest_team_name(league1_obj, team1)
+            hint = f" Did you mean **{suggestion}**?" if suggestion else ""
+            await interaction.followup.send(f"❌ Team '{team1}' not found in {league1_name}.{hint}")
             return
         if not team2_obj:
-            await interaction.followup.send(f"❌ Team '{team2}' not found in {league2_name}.")
+            suggestion = suggest_team_name(league2_obj, team2)
+            hint = f" Did you mean **{suggestion}**?" if suggestion else ""
+            await interaction.followup.send(f"❌ Team '{team2}' not found in {league2_name}.{hint}")
             return
 
         # Create comparison embed
@@ -4571,65 +4221,32 @@ async def compare_cross_league(interaction: discord.Interaction, team1: str, tea
             inline=False
         )
 
-        # Helper functions for player data (reused from other commands)
-        def get_actual_points(player, league_ref):
-            """Get actual points for current week"""
-            try:
-                current_week = getattr(league_ref, 'current_week', 1)
-                if hasattr(player, 'stats') and player.stats:
-                    week_stats = player.stats.get(current_week, {})
-                    actual_points = week_stats.get('points', None)
-                    if actual_points is not None and actual_points > 0:
-                        return actual_points
-            except:
-                pass
-            return 0
-
-        def get_player_status(player):
-            """Get injury status"""
-            status_abbrev = {
-                'ACTIVE': '', 'QUESTIONABLE': 'Q', 'OUT': 'O', 'INJURY_RESERVE': 'IR', 'NORMAL': '', None: ''
-            }
-            # Don't show status for D/ST
-            pos = getattr(player, 'position', '')
-            if pos in ['D/ST', 'DST', 'DEF']:
-                return ''
-
-            status = getattr(player, 'injuryStatus', None)
-            abbrev = status_abbrev.get(status, '')
-            return f" ({abbrev})" if abbrev else ''
-
+        # Build the lineup code block and weekly total for one team
         def create_team_roster_text(team, league_ref, team_name):
             """Create roster text with weekly points"""
-            starters = [p for p in team.roster if getattr(p, 'lineupSlot', None) != "BE"]
+            starters = get_roster_summary(team)['starters']
 
             # Group by position with proper ordering
-            position_order = ['QB', 'RB', 'WR', 'TE', 'FLEX', 'K', 'D/ST', 'DST']
-
-            def get_position_priority(player):
-                pos = getattr(player, 'position', 'FLEX')
-                return position_order.index(pos) if pos in position_order else 99
-
             starters_sorted = sorted(starters, key=get_position_priority)
 
-            lines = []
-            lines.append(f"{'Pos':<3} {'Player':<18} {'Pts':<4}")
-            lines.append(f"{'-'*3} {'-'*18} {'-'*4}")
+            lines = [LINEUP_TEXT_HEADER, LINEUP_TEXT_DIVIDER]
 
+            # The week is the same for every player on the team
+            current_week = getattr(league_ref, 'current_week', 1)
             total_points = 0
             for player in starters_sorted:
                 pos = getattr(player, 'position', 'FLEX')[:3]
                 status = get_player_status(player)
                 name = (player.name + status)[:18]  # Truncate with status
-                actual = get_actual_points(player, league_ref)
+                actual = get_week_actual_points(player, current_week)
                 total_points += actual
 
                 lines.append(f"{pos:<3} {name:<18} {actual:<4.1f}")
 
-            lines.append(f"{'-'*3} {'-'*18} {'-'*4}")
+            lines.append(LINEUP_TEXT_DIVIDER)
             lines.append(f"{'TOT':<3} {'TOTAL':<18} {total_points:<4.1f}")
 
-            return f"```\n{chr(10).join(lines)}\n```", total_points
+            return "```\n" + "\n".join(lines) + "\n```", total_points
 
         # Get current week rosters with points
         team1_roster_text, team1_week_total = create_team_roster_text(team1_obj, league1_obj, team1_obj.team_name)
@@ -4686,7 +4303,7 @@ async def league_info(interaction: discord.Interaction):
         return
 
     try:
-        league = get_league(user_id=interaction.user.id)
+        league = get_league(user_id=interaction.user.id, use_cache=True)
         if not league:
             await safe_interaction_response(interaction, "❌ No league found. Use `/register_league` to add your ESPN Fantasy League first, or contact an admin if you want to use the default league.", ephemeral=True)
             return
@@ -4704,24 +4321,26 @@ async def league_info(interaction: discord.Interaction):
         # Get league settings first
         settings = getattr(league, 'settings', None)
         scoring_format = "Unknown"
+        # Scoring rule points by stat abbreviation, indexed once for the format and key scoring sections
+        scoring_points = {}
 
         if settings:
             # Scoring format - determine PPR/Half-PPR/Standard
             try:
-                if hasattr(settings, 'scoring_format') and isinstance(settings.scoring_format, list):
+                scoring_rules = getattr(settings, 'scoring_format', None)
+                if isinstance(scoring_rules, list):
+                    scoring_points = {rule.get('abbr', ''): rule.get('points', 0) for rule in scoring_rules if isinstance(rule, dict)}
                     # Look for reception scoring in the detailed rules
-                    for rule in settings.scoring_format:
-                        if isinstance(rule, dict) and rule.get('abbr') == 'REC':
-                            points = rule.get('points', 0)
-                            if points == 1.0:
-                                scoring_format = "PPR (Full Point)"
-                            elif points == 0.5:
-                                scoring_format = "Half-PPR"
-                            elif points == 0:
-                                scoring_format = "Standard (No PPR)"
-                            else:
-                                scoring_format = f"Custom PPR ({points} pts)"
-                            break
+                    if 'REC' in scoring_points:
+                        points = scoring_points['REC']
+                        if points == 1.0:
+                            scoring_format = "PPR (Full Point)"
+                        elif points == 0.5:
+                            scoring_format = "Half-PPR"
+                        elif points == 0:
+                            scoring_format = "Standard (No PPR)"
+                        else:
+                            scoring_format = f"Custom PPR ({points} pts)"
                     else:
                         # If no REC rule found, assume Standard
                         scoring_format = "Standard (No PPR)"
@@ -4761,10 +4380,12 @@ async def league_info(interaction: discord.Interaction):
         # Add playoff info if available
         playoff_info = "TBD"
         if settings:
-            if hasattr(settings, 'playoff_team_count'):
-                playoff_info = f"**{settings.playoff_team_count} Teams**"
-                if hasattr(settings, 'playoff_week_start'):
-                    playoff_info += f"\n*Starts Week {settings.playoff_week_start}*"
+            playoff_team_count = getattr(settings, 'playoff_team_count', None)
+            if playoff_team_count is not None:
+                playoff_info = f"**{playoff_team_count} Teams**"
+                playoff_week_start = getattr(settings, 'playoff_week_start', None)
+                if playoff_week_start is not None:
+                    playoff_info += f"\n*Starts Week {playoff_week_start}*"
 
         embed.add_field(
             name="🏆 Playoffs",
@@ -4780,8 +4401,9 @@ async def league_info(interaction: discord.Interaction):
             # Analyze roster composition from first team
             sample_team = league.teams[0]
             if hasattr(sample_team, 'roster'):
-                starters = [p for p in sample_team.roster if getattr(p, 'lineupSlot', None) != "BE"]
-                bench = [p for p in sample_team.roster if getattr(p, 'lineupSlot', None) == "BE"]
+                roster_summary = get_roster_summary(sample_team)
+                starters = roster_summary['starters']
+                bench = roster_summary['bench']
 
                 # Total roster info
                 embed.add_field(
@@ -4801,10 +4423,7 @@ async def league_info(interaction: discord.Interaction):
                 )
 
                 # Count positions in starting lineup
-                position_counts = {}
-                for player in starters:
-                    pos = getattr(player, 'position', 'UNKNOWN')
-                    position_counts[pos] = position_counts.get(pos, 0) + 1
+                position_counts = roster_summary['position_counts']
 
                 if position_counts:
                     # Format position breakdown with better spacing
@@ -4831,27 +4450,11 @@ async def league_info(interaction: discord.Interaction):
         # Scoring & Settings Details
         if settings:
             # Key scoring highlights
-            scoring_details = []
-            try:
-                if hasattr(settings, 'scoring_format') and isinstance(settings.scoring_format, list):
-                    # Look for key scoring rules
-                    key_scores = {}
-                    for rule in settings.scoring_format:
-                        if isinstance(rule, dict):
-                            abbr = rule.get('abbr', '')
-                            points = rule.get('points', 0)
-                            if abbr == 'RTD':  # Rushing TD
-                                key_scores['🏃 Rushing TD'] = f"**{points}** pts"
-                            elif abbr == 'RETD':  # Receiving TD
-                                key_scores['🤲 Receiving TD'] = f"**{points}** pts"
-                            elif abbr == 'PTD':  # Passing TD
-                                key_scores['🎯 Passing TD'] = f"**{points}** pts"
-
-                    if key_scores:
-                        for score_type, points in key_scores.items():
-                            scoring_details.append(f"{score_type}: {points}")
-            except:
-                pass
+            scoring_details = [
+                f"{score_type}: **{scoring_points[abbr]}** pts"
+                for abbr, score_type in KEY_SCORING_RULES
+                if abbr in scoring_points
+            ]
 
             if scoring_details:
                 scoring_text = "\n".join(scoring_details)
@@ -4868,16 +4471,16 @@ async def league_info(interaction: discord.Interaction):
             league_rules = []
 
             # Regular season length
-            if hasattr(settings, 'reg_season_count'):
-                league_rules.append(f"📅 **Regular Season:** {settings.reg_season_count} weeks")
+            reg_season_count = getattr(settings, 'reg_season_count', None)
+            if reg_season_count is not None:
+                league_rules.append(f"📅 **Regular Season:** {reg_season_count} weeks")
 
             # Trade settings
-            if hasattr(settings, 'trade_deadline'):
+            trade_deadline = getattr(settings, 'trade_deadline', None)
+            if trade_deadline is not None:
                 # Convert timestamp to week number if needed
-                trade_deadline = settings.trade_deadline
                 if isinstance(trade_deadline, (int, float)) and trade_deadline > 1000000000:
                     # This is a timestamp, convert to a readable format
-                    import datetime
                     try:
                         date = datetime.datetime.fromtimestamp(trade_deadline / 1000)
                         trade_deadline_str = f"{date.strftime('%b %d, %Y')}"
@@ -4892,8 +4495,9 @@ async def league_info(interaction: discord.Interaction):
                 league_rules.append(f"🔄 **Trade Deadline:** {trade_deadline_str}")
 
             # Waiver settings
-            if hasattr(settings, 'waiver_order_type'):
-                league_rules.append(f"📋 **Waivers:** {settings.waiver_order_type}")
+            waiver_order_type = getattr(settings, 'waiver_order_type', None)
+            if waiver_order_type is not None:
+                league_rules.append(f"📋 **Waivers:** {waiver_order_type}")
 
             if league_rules:
                 rules_text = "\n".join(league_rules)
@@ -4917,7 +4521,14 @@ async def league_info(interaction: discord.Interaction):
 
         # Current Season Stats
         if hasattr(league, 'teams') and league.teams:
-            total_points = sum(team.points_for for team in league.teams if hasattr(team, 'points_for'))
+            # Total points and the top scoring team in a single pass over the teams
+            total_points = 0
+            top_team, top_points = None, 0
+            for team in league.teams:
+                points_for = getattr(team, 'points_for', 0)
+                total_points += points_for
+                if top_team is None or points_for > top_points:
+                    top_team, top_points = team, points_for
             avg_points = total_points / len(league.teams)
 
             # Total points
@@ -4934,8 +4545,7 @@ async def league_info(interaction: discord.Interaction):
                 inline=True
             )
 
-            # Find highest scoring team
-            top_team = max(league.teams, key=lambda t: getattr(t, 'points_for', 0))
+            # Highest scoring team
             embed.add_field(
                 name="🏆 Top Scoring Team",
                 value=f"**{top_team.team_name}**\n{top_team.points_for:.1f} points",
@@ -5107,9 +4717,6 @@ async def help_command(interaction: discord.Interaction):
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 if __name__ == '__main__':
-    import time
-    import traceback
-
     max_restarts = 5
     restart_count = 0
 